@@ -23,8 +23,16 @@ OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SO
 
 import time
 import random
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from typing import Any, Optional
+import bitboard
 from reversi import ReversiGame
 from game_tree import GameTree
+from transposition import TranspositionTable, EXACT, LOWER, UPPER
+from move_ordering import MoveOrderer
+from endgame import EndgameSolver, count_empties
+from opening_book import OpeningBook, get_book_path, load_book, write_book
 
 
 # POSITIONAL_HEURISTIC is a heuristic function that prioritizes
@@ -57,27 +65,75 @@ def heuristic(game: ReversiGame, heuristic_list: list[list[int]]) -> float:
     """
     heuristic takes a given heuristic_list and returns the game-state value
     given by the list
+
+    If heuristic_list is the heuristic table of game (see ReversiGame.set_heuristic), the
+    value is read from the game's running positional score instead of being calculated.
+
+    >>> game = ReversiGame()
+    >>> game.make_move((2, 4))
+    >>> heuristic(game, POSITIONAL_HEURISTIC)
+    3
+    >>> game.set_heuristic(POSITIONAL_HEURISTIC)
+    >>> heuristic(game, POSITIONAL_HEURISTIC)
+    3
+    """
+    game_over = game.get_winner() is not None
+    if not game_over and game.get_heuristic_list() is heuristic_list:
+        return game.get_positional_score()
+    black, white = game.get_bitboards()
+    return evaluate_bitboards(black, white, game_over, heuristic_list)
+
+
+def evaluate_bitboards(black: int, white: int, game_over: bool,
+                       heuristic_list: list[list[int]]) -> float:
+    """
+    evaluate_bitboards returns the game-state value given by heuristic_list of the position with
+    the given black and white bitboards, which is over if game_over is True
+
+    The squares are grouped by their weight in heuristic_list, so the value is found by counting
+    the pieces of each player on each group of squares, instead of looking at every square.
     """
-    if game.get_winner() is None:
-        pieces = game.get_board().pieces
-        black = 0
-        white = 0
-        length = len(pieces)
-        for i in range(length):
-            for m in range(length):
-                if pieces[i][m] == 1:
-                    black += heuristic_list[i][m]
-                elif pieces[i][m] == -1:
-                    white += heuristic_list[i][m]
-        return white - black
-    elif game.get_winner() == 'white':
+    if not game_over:
+        value = 0
+        for weight, mask in _get_weight_masks(heuristic_list):
+            value += weight * (bitboard.count(white & mask) - bitboard.count(black & mask))
+        return value
+    num_black = bitboard.count(black)
+    num_white = bitboard.count(white)
+    if num_white > num_black:
         return 100000
-    elif game.get_winner() == 'black':
+    elif num_white < num_black:
         return -100000
     else:
         return 0
 
 
+# The weight masks of the heuristic lists used so far, keyed by the contents of the list, so
+# that equal lists (such as the basic_heuristic lists of every player on the same board size)
+# share one entry.
+_WEIGHT_MASKS: dict[tuple[tuple[int, ...], ...], list[tuple[int, int]]] = {}
+
+
+def _get_weight_masks(heuristic_list: list[list[int]]) -> list[tuple[int, int]]:
+    """Return a (weight, mask) tuple for every nonzero weight in heuristic_list, where mask is
+    the bitboard of the squares with that weight.
+
+    >>> _get_weight_masks([[1, 2], [0, 1]])
+    [(1, 9), (2, 2)]
+    """
+    key = tuple(tuple(row) for row in heuristic_list)
+    if key not in _WEIGHT_MASKS:
+        size = len(heuristic_list)
+        masks = {}
+        for i in range(size):
+            for m in range(size):
+                weight = heuristic_list[i][m]
+                if weight != 0:
+                    masks[weight] = masks.get(weight, 0) | 1 << (i * size + m)
+        _WEIGHT_MASKS[key] = list(masks.items())
+    return _WEIGHT_MASKS[key]
+
+
 class Player:
     """
     Player is an abstract class that represents a reversi ai and is capable
@@ -90,6 +146,10 @@ class Player:
 
     heuristic_list: list[list[int]]
 
+    # Private Instance Attributes:
+    # - _stop_requested: whether a search running in make_move should end as soon as possible
+    _stop_requested: bool = False
+
     def make_move(self, game: ReversiGame, previous_move: tuple[int, int]) -> tuple[int, int]:
         """
         make_move is a function that takes a game position and the previous
@@ -110,6 +170,20 @@ class Player:
         else:
             self.heuristic_list = basic_heuristic(size)
 
+    def stop(self) -> None:
+        """Ask a make_move call running on another thread to end as soon as possible. It may
+        then raise an exception or return a worse move, and leave moves made on the game it was
+        given, so neither should be used. Until resume is called, every make_move call ends
+        early.
+
+        Players whose searches are quick do not check this and always finish.
+        """
+        self._stop_requested = True
+
+    def resume(self) -> None:
+        """Let make_move search normally again after stop was called."""
+        self._stop_requested = False
+
 
 class RandomPlayer(Player):
     """
@@ -126,48 +200,59 @@ class MinimaxPlayer(Player):
 
     Instance Attributes:
      - depth: the depth that the player will calculate to when making a decision
+     - build_tree: whether make_move also builds the GameTree of every position it searches
+                   (for debugging and analysis only, as the tree takes a lot of memory)
+     - last_tree: the GameTree built on the last call to make_move, or None if build_tree
+                  was False
 
      Representation Invariant:
       - self.depth > 0
     """
     depth: int
+    build_tree: bool
+    last_tree: Optional[GameTree]
 
-    def __init__(self, depth: int, board_size: int) -> None:
+    def __init__(self, depth: int, board_size: int, build_tree: bool = False) -> None:
         self.depth = depth
+        self.build_tree = build_tree
+        self.last_tree = None
         self.set_heuristic(board_size)
 
     def make_move(self, game: ReversiGame, previous_move: tuple[int, int]) -> tuple[int, int]:
-        tree = self._minimax(previous_move, game, 0)
-        subtrees = tree.get_subtrees()
-        # maximize if white's turn, else minimize
-        if tree.is_white_move:
-            best_tree = max(subtrees, key=lambda x: x.evaluation)
-        else:
-            best_tree = min(subtrees, key=lambda x: x.evaluation)
-        return best_tree.move
+        game.set_heuristic(self.heuristic_list)
+        self.last_tree = None
+        if self.build_tree:
+            self.last_tree = GameTree(move=previous_move,
+                                      is_white_move=game.get_current_player() == -1)
+        evaluation, best_move = self._minimax(game, 0, self.last_tree)
+        if self.last_tree is not None:
+            self.last_tree.evaluation = evaluation
+        return best_move
 
-    def _minimax(self, root_move: tuple[int, int], game: ReversiGame, depth: int) -> GameTree:
+    def _minimax(self, game: ReversiGame, depth: int, tree: Optional[GameTree]) \
+            -> tuple[float, Optional[tuple[int, int]]]:
         """
-        _minimax is a function that returns a tree where each node has a value determined by
-        the minimax search algorithm
+        _minimax is a function that returns the value of the position determined by the
+        minimax search algorithm, and the best move in the position (None if the position was
+        not searched further)
+
+        If tree is not None, the subtrees of every searched move are added to it.
         """
         white_move = (game.get_current_player() == -1)
-        ret = GameTree(move=root_move, is_white_move=white_move)
         # early return if we have reached max depth
         if depth == self.depth:
-            ret.evaluation = heuristic(game, self.heuristic_list)
-            return ret
+            return heuristic(game, self.heuristic_list), None
         possible_moves = list(game.get_valid_moves())
         # game is over if there are no possible moves in a position
         if not possible_moves:
             # if there are no moves, then the game is over so we check for the winner
-            if game.get_winner() == 'white':
-                ret.evaluation = 10000
-            elif game.get_winner() == 'black':
-                ret.evaluation = -10000
+            winner = game.get_winner()
+            if winner == 'white':
+                return 10000, None
+            elif winner == 'black':
+                return -10000, None
             else:
-                ret.evaluation = 0
-            return ret
+                return 0, None
         # shuffle for randomness
         random.shuffle(possible_moves)
         # best_value tracks the best possible move that the player can make
@@ -175,17 +260,24 @@ class MinimaxPlayer(Player):
         best_value = float('-inf')
         if not white_move:
             best_value = float('inf')
+        best_move = None
         for move in possible_moves:
-            new_game = game.copy_and_make_move(move)
-            new_subtree = self._minimax(move, new_game, depth + 1)
-            if white_move:
-                best_value = max(best_value, new_subtree.evaluation)
-            else:
-                best_value = min(best_value, new_subtree.evaluation)
-            ret.add_subtree(new_subtree)
-        # update the evaluation value of the tree once all subtrees are added
-        ret.evaluation = best_value
-        return ret
+            # search the move in place and undo it afterwards instead of copying the game
+            game.push_move(move)
+            subtree = _add_subtree(tree, move, game)
+            value = self._minimax(game, depth + 1, subtree)[0]
+            game.pop_move()
+            if subtree is not None:
+                subtree.evaluation = value
+            if (white_move and value > best_value) or (not white_move and value < best_value):
+                best_value = value
+                best_move = move
+        return best_value, best_move
+
+
+class _SearchTimeout(Exception):
+    """Raised inside a search when the time given for the move has run out, or when the
+    search was asked to stop."""
 
 
 class MinimaxABPlayer(Player):
@@ -195,72 +287,835 @@ class MinimaxABPlayer(Player):
 
     Instance Attributes:
      - depth: the depth that the player will calculate to when making a decision
+     - transposition_table: the table of positions searched so far, or None if the player
+                            does not use one. It is kept between calls to make_move, so
+                            positions searched for an earlier move are not searched again.
+     - move_orderer: the MoveOrderer deciding the order moves are searched in, or None if the
+                     moves are searched in a random order
+     - nodes_searched: the number of positions searched on the last call to make_move
+     - principal_variation: the moves the player expects to be played from the position of
+                            the last call to make_move, starting with the move it chose
+     - build_tree: whether make_move also builds the GameTree of every position it searches
+                   (for debugging and analysis only, as the tree takes a lot of memory)
+     - last_tree: the GameTree built on the last call to make_move, or None if build_tree
+                  was False
+     - endgame_empties: the number of empty squares at or below which the player solves the
+                        rest of the game exactly instead of searching to self.depth
+     - endgame_solver: the EndgameSolver used once there are endgame_empties empty squares
+                       left, or None if the player does not use one
+     - use_book: whether the player plays from the opening book of the board size
+     - opening_book: the OpeningBook the player plays from while the position is in it, or
+                     None if the player does not use one (or there is no book for the size)
+     - evaluation: the value of the position found by the last search
 
      Representation Invariant:
       - self.depth > 0
+      - self.endgame_empties >= 0
     """
     depth: int
+    transposition_table: Optional[TranspositionTable]
+    move_orderer: Optional[MoveOrderer]
+    nodes_searched: int
+    principal_variation: list[tuple[int, int]]
+    build_tree: bool
+    last_tree: Optional[GameTree]
+    endgame_empties: int
+    endgame_solver: Optional[EndgameSolver]
+    use_book: bool
+    opening_book: Optional[OpeningBook]
+    evaluation: float
 
-    def __init__(self, depth: int, board_size: int) -> None:
+    def __init__(self, depth: int, board_size: int, table_memory_mb: float = 16.0,
+                 move_ordering: bool = True, build_tree: bool = False,
+                 endgame_empties: int = 10, use_book: bool = True) -> None:
+        """Initialize the player. The transposition table uses at most about
+        <table_memory_mb> megabytes; if table_memory_mb is 0, no table is used. If
+        endgame_empties is 0, the endgame is never solved exactly. If use_book is True, the
+        opening book for the board size is used (if it has been built with
+        build_opening_book)."""
         self.depth = depth
+        self.evaluation = 0
+        self.nodes_searched = 0
+        self.principal_variation = []
+        self.build_tree = build_tree
+        self.last_tree = None
+        self.move_orderer = None
+        self.endgame_empties = endgame_empties
+        self.endgame_solver = None
+        self.use_book = use_book
+        self.opening_book = None
         self.set_heuristic(board_size)
+        if move_ordering:
+            self.move_orderer = MoveOrderer(POSITIONAL_HEURISTIC, board_size)
+        if endgame_empties > 0:
+            self.endgame_solver = EndgameSolver(board_size)
+        if table_memory_mb > 0:
+            self.transposition_table = TranspositionTable(table_memory_mb)
+        else:
+            self.transposition_table = None
+
+    def set_heuristic(self, size: int) -> None:
+        """Set the heuristic array based on board size, reset the move orderer and the endgame
+        solver (if there are any) for the new size, and load the opening book of the new size
+        if the player uses books."""
+        super().set_heuristic(size)
+        if self.move_orderer is not None:
+            self.move_orderer = MoveOrderer(POSITIONAL_HEURISTIC, size)
+        if self.endgame_solver is not None:
+            self.endgame_solver = EndgameSolver(size)
+        if self.use_book:
+            self.opening_book = load_book(size)
 
     def make_move(self, game: ReversiGame, previous_move: tuple[int, int]) -> tuple[int, int]:
-        tree = self._minimax(previous_move, 0, game, float('-inf'), float('inf'))
-        subtrees = tree.get_subtrees()
-        # maximize if white's turn, else minimize
-        if tree.is_white_move:
-            best_tree = max(subtrees, key=lambda x: x.evaluation)
+        known_move = self._get_known_move(game)
+        if known_move is not None:
+            return known_move
+        self.nodes_searched = 0
+        if self.move_orderer is not None:
+            self.move_orderer.new_search()
+        best_move = self._search_root(game, previous_move)
+        self.principal_variation = self._get_principal_variation(game, best_move)
+        return best_move
+
+    def _get_known_move(self, game: ReversiGame) -> Optional[tuple[int, int]]:
+        """Return the move of game in the opening book, or the best move found by the endgame
+        solver if there are few enough empty squares left, or None if the move has to be
+        found by searching.
+
+        Preconditions:
+            - game.get_winner() is None
+        """
+        move = None
+        if self.opening_book is not None:
+            move = self.opening_book.lookup(game)
+            self.nodes_searched = 0
+        if move is None and self.endgame_solver is not None \
+                and count_empties(game) <= self.endgame_empties:
+            self.evaluation, move = self.endgame_solver.solve(game)
+            self.nodes_searched = self.endgame_solver.nodes_searched
+        if move is not None:
+            self.principal_variation = [move]
+        return move
+
+    def _search_root(self, game: ReversiGame, previous_move: tuple[int, int],
+                     alpha: float = float('-inf'), beta: float = float('inf')) -> tuple[int, int]:
+        """Search game to self.depth with the window (alpha, beta) and return the best move,
+        building self.last_tree if self.build_tree is True.
+
+        If the value of game is not between alpha and beta, self.evaluation is only a bound on
+        it, and the move is not necessarily the best one.
+
+        Preconditions:
+            - game.get_winner() is None
+        """
+        game.set_heuristic(self.heuristic_list)
+        self.last_tree = None
+        if self.build_tree:
+            self.last_tree = GameTree(move=previous_move,
+                                      is_white_move=game.get_current_player() == -1)
+        self.evaluation, best_move = self._minimax(game, 0, alpha, beta, self.last_tree)
+        if self.last_tree is not None:
+            self.last_tree.evaluation = self.evaluation
+        return best_move
+
+    def search_root_move(self, game: ReversiGame, move: tuple[int, int],
+                         bound: float) -> tuple[float, int, list[tuple[int, int]]]:
+        """Search the position after move in game to self.depth, and return the value of move
+        from the point of view of the player making it, the number of positions searched and
+        the principal variation starting with move.
+
+        The value is exact if it is more than bound, and otherwise it is only known to be at
+        most bound.
+
+        Preconditions:
+            - move in game.get_valid_moves()
+        """
+        self.nodes_searched = 0
+        if self.move_orderer is not None:
+            self.move_orderer.new_search()
+        sign = 1 if game.get_current_player() == -1 else -1
+        game.set_heuristic(self.heuristic_list)
+        game.push_move(move)
+        if sign == 1:
+            value = self._minimax(game, 1, bound, float('inf'), None)[0]
         else:
-            best_tree = min(subtrees, key=lambda x: x.evaluation)
-        return best_tree.move
+            value = self._minimax(game, 1, float('-inf'), -bound, None)[0]
+        game.pop_move()
+        return sign * value, self.nodes_searched, self._get_principal_variation(game, move)
 
-    def _minimax(self, root_move: tuple[int, int], depth: int, game: ReversiGame,
-                 alpha: float, beta: float) -> GameTree:
+    def _minimax(self, game: ReversiGame, depth: int, alpha: float, beta: float,
+                 tree: Optional[GameTree]) -> tuple[float, Optional[tuple[int, int]]]:
         """
         _minimax is a minimax function with alpha-beta pruning implemented that returns
-        a full GameTree where each node stores the given evaluation
+        the value of the position and the best move in the position (None if the position was
+        not searched further)
+
+        If the position was already searched deeply enough, the result stored in the
+        transposition table is used instead of searching it again (except at the root, where
+        a move has to be chosen).
+
+        If tree is not None, the subtrees of every searched move are added to it.
 
         Preconditions
             - depth >= 0
         """
+        if self._stop_requested:
+            raise _SearchTimeout
+        self.nodes_searched += 1
         white_move = (game.get_current_player() == -1)
-        ret = GameTree(move=root_move, is_white_move=white_move)
         # early return at max depth
         if depth == self.depth:
-            ret.evaluation = heuristic(game, self.heuristic_list)
-            return ret
+            return heuristic(game, self.heuristic_list), None
         possible_moves = list(game.get_valid_moves())
         if not possible_moves:
-            if game.get_winner() == 'white':
-                ret.evaluation = 10000
-            elif game.get_winner() == 'black':
-                ret.evaluation = -10000
+            winner = game.get_winner()
+            if winner == 'white':
+                return 10000, None
+            elif winner == 'black':
+                return -10000, None
             else:
-                ret.evaluation = 0
-            return ret
-        random.shuffle(possible_moves)
+                return 0, None
+
+        hash_move = None
+        key, transform, entry = self._probe_table(game)
+        if entry is not None:
+            _, entry_depth, flag, hash_move, score = entry
+            if depth > 0 and entry_depth >= self.depth - depth and \
+                    (flag == EXACT or (flag == LOWER and score >= beta)
+                     or (flag == UPPER and score <= alpha)):
+                return score, hash_move
+
+        possible_moves = self._order_moves(possible_moves, depth, hash_move)
+        original_alpha, original_beta = alpha, beta
+        best_move = None
         best_value = float('-inf')
         if not white_move:
             best_value = float('inf')
+        # the children of a frontier node are all leaves, so they are evaluated straight from
+        # their bitboards, without making the moves or searching them recursively
+        frontier = depth == self.depth - 1 and tree is None \
+            and game.get_heuristic_list() is self.heuristic_list
         for move in possible_moves:
-            new_game = game.copy_and_make_move(move)
-            new_tree = self._minimax(move, depth + 1, new_game, alpha, beta)
-            ret.add_subtree(new_tree)
+            if frontier:
+                self.nodes_searched += 1
+                black, white, game_over, value = game.get_move_result(move)
+                if game_over:
+                    value = evaluate_bitboards(black, white, game_over, self.heuristic_list)
+            else:
+                game.push_move(move)
+                subtree = _add_subtree(tree, move, game)
+                value = self._minimax(game, depth + 1, alpha, beta, subtree)[0]
+                game.pop_move()
+                if subtree is not None:
+                    subtree.evaluation = value
             # we update the alpha value when the maximizer is playing (white)
-            if white_move and best_value < new_tree.evaluation:
-                best_value = new_tree.evaluation
+            if white_move and best_value < value:
+                best_value = value
+                best_move = move
                 alpha = max(alpha, best_value)
                 if beta <= alpha:
+                    self._record_cutoff(move, depth)
                     break
             # we update the beta value when the minimizer is playing (black)
-            elif not white_move and best_value > new_tree.evaluation:
-                best_value = new_tree.evaluation
+            elif not white_move and best_value > value:
+                best_value = value
+                best_move = move
                 beta = min(beta, best_value)
                 if beta <= alpha:
+                    self._record_cutoff(move, depth)
                     break
-        ret.evaluation = best_value
-        return ret
+
+        self._store_result(game, key, transform, depth, original_alpha, original_beta,
+                           best_value, best_move)
+        return best_value, best_move
+
+    def _probe_table(self, game: ReversiGame) \
+            -> tuple[int, int, Optional[tuple[int, int, int, Optional[tuple[int, int]], float]]]:
+        """Return the canonical hash of game, the transform that moves game to its canonical
+        position, and the transposition table entry of game (or None if there is no table or
+        no entry). The best move of the entry is moved back from the canonical position to game.
+
+        The table is keyed by the canonical version of the position, so symmetric positions
+        share their entries.
+        """
+        if self.transposition_table is None:
+            return 0, 0, None
+        key, transform = game.get_canonical_hash()
+        entry = self.transposition_table.probe(key)
+        if entry is not None and entry[3] is not None:
+            entry = (entry[0], entry[1], entry[2],
+                     game.transform_move(entry[3], bitboard.INVERSE_TRANSFORMS[transform]),
+                     entry[4])
+        return key, transform, entry
+
+    def _store_result(self, game: ReversiGame, key: int, transform: int, depth: int,
+                      alpha: float, beta: float, value: float,
+                      best_move: Optional[tuple[int, int]]) -> None:
+        """Store the value and the best move found by a search of game at depth with the window
+        (alpha, beta) in the transposition table (if there is one), where key and transform are
+        as returned by _probe_table."""
+        if self.transposition_table is None:
+            return
+        if value <= alpha:
+            flag = UPPER
+        elif value >= beta:
+            flag = LOWER
+        else:
+            flag = EXACT
+        if best_move is not None:
+            best_move = game.transform_move(best_move, transform)
+        self.transposition_table.store(key, self.depth - depth, flag, best_move, value)
+
+    def _order_moves(self, possible_moves: list[tuple[int, int]], depth: int,
+                     hash_move: Optional[tuple[int, int]]) -> list[tuple[int, int]]:
+        """Return possible_moves in the order they should be searched in at depth, where
+        hash_move is the best move stored in the transposition table (if any)."""
+        if self.move_orderer is not None:
+            return self.move_orderer.order_moves(possible_moves, depth, hash_move)
+        random.shuffle(possible_moves)
+        # search the best move found last time first, as it is likely to cause a cutoff
+        if hash_move in possible_moves:
+            possible_moves.remove(hash_move)
+            possible_moves.insert(0, hash_move)
+        return possible_moves
+
+    def _record_cutoff(self, move: tuple[int, int], depth: int) -> None:
+        """Tell the move orderer (if there is one) that move caused a cutoff at depth."""
+        if self.move_orderer is not None:
+            self.move_orderer.record_cutoff(move, depth, self.depth - depth)
+
+    def _get_principal_variation(self, game: ReversiGame,
+                                 best_move: tuple[int, int]) -> list[tuple[int, int]]:
+        """Return the principal variation starting with best_move, by following the best moves
+        stored in the transposition table (or just [best_move] if there is no table)."""
+        variation = [best_move]
+        if self.transposition_table is None:
+            return variation
+        game.push_move(best_move)
+        while len(variation) < self.depth:
+            key, transform = game.get_canonical_hash()
+            entry = self.transposition_table.peek(key)
+            if entry is None or entry[3] is None:
+                break
+            move = game.transform_move(entry[3], bitboard.INVERSE_TRANSFORMS[transform])
+            if move not in game.get_valid_moves():
+                break
+            variation.append(move)
+            game.push_move(move)
+        for _ in variation:
+            game.pop_move()
+        return variation
+
+
+class PVSPlayer(MinimaxABPlayer):
+    """
+    PVSPlayer is a MinimaxABPlayer that uses Principal Variation Search (also called NegaScout)
+    instead of plain alpha-beta.
+
+    With good move ordering the first move of a position is usually the best one, so only the
+    first move is searched with the full (alpha, beta) window. Every other move is searched with
+    a null window (alpha, alpha + 1), which only proves that the move is no better than the
+    first one and prunes far more. If the null window search fails high, the move is better
+    after all, and it is searched again with the full window. The evaluations are integers, so
+    a null window of width 1 never hides a better move.
+
+    The search is written in negamax form: the value of a position is from the point of view of
+    the player to move, and is negated when it is passed up to the parent. The player does not
+    build a GameTree, even if build_tree is True.
+    """
+
+    def _minimax(self, game: ReversiGame, depth: int, alpha: float, beta: float,
+                 tree: Optional[GameTree]) -> tuple[float, Optional[tuple[int, int]]]:
+        """Return the value of the position (positive if white is ahead) found by
+        _principal_variation_search, and the best move in the position."""
+        if game.get_current_player() == -1:
+            return self._principal_variation_search(game, depth, alpha, beta)
+        value, best_move = self._principal_variation_search(game, depth, -beta, -alpha)
+        return -value, best_move
+
+    def _principal_variation_search(self, game: ReversiGame, depth: int, alpha: float,
+                                    beta: float) -> tuple[float, Optional[tuple[int, int]]]:
+        """
+        Return the value of the position from the point of view of the player to move, and
+        the best move in the position (None if the position was not searched further).
+
+        If the value is not between alpha and beta, a bound on it is returned instead.
+
+        Preconditions
+            - depth >= 0
+        """
+        if self._stop_requested:
+            raise _SearchTimeout
+        self.nodes_searched += 1
+        sign = 1 if game.get_current_player() == -1 else -1
+        if depth == self.depth:
+            return sign * heuristic(game, self.heuristic_list), None
+        possible_moves = list(game.get_valid_moves())
+        if not possible_moves:
+            winner = game.get_winner()
+            if winner == 'white':
+                return sign * 10000, None
+            elif winner == 'black':
+                return -sign * 10000, None
+            else:
+                return 0, None
+
+        hash_move = None
+        key, transform, entry = self._probe_table(game)
+        if entry is not None:
+            _, entry_depth, flag, hash_move, score = entry
+            if depth > 0 and entry_depth >= self.depth - depth and \
+                    (flag == EXACT or (flag == LOWER and score >= beta)
+                     or (flag == UPPER and score <= alpha)):
+                return score, hash_move
+
+        possible_moves = self._order_moves(possible_moves, depth, hash_move)
+        original_alpha = alpha
+        best_move = None
+        best_value = float('-inf')
+        frontier = depth == self.depth - 1 \
+            and game.get_heuristic_list() is self.heuristic_list
+        for move in possible_moves:
+            if frontier:
+                self.nodes_searched += 1
+                black, white, game_over, value = game.get_move_result(move)
+                if game_over:
+                    value = evaluate_bitboards(black, white, game_over, self.heuristic_list)
+                value *= sign
+            else:
+                game.push_move(move)
+                if best_move is None:
+                    value = -self._principal_variation_search(game, depth + 1, -beta, -alpha)[0]
+                else:
+                    value = -self._principal_variation_search(game, depth + 1, -alpha - 1,
+                                                              -alpha)[0]
+                    if alpha < value < beta:
+                        # the move is better than the best move so far, so find its value
+                        value = -self._principal_variation_search(game, depth + 1, -beta,
+                                                                  -value)[0]
+                game.pop_move()
+            if value > best_value:
+                best_value = value
+                best_move = move
+                if value > alpha:
+                    alpha = value
+                    if alpha >= beta:
+                        self._record_cutoff(move, depth)
+                        break
+
+        self._store_result(game, key, transform, depth, original_alpha, beta, best_value,
+                           best_move)
+        return best_value, best_move
+
+
+class MTDFPlayer(PVSPlayer):
+    """
+    MTDFPlayer is a player that finds the value of a position with MTD(f): a sequence of
+    alpha-beta searches with null windows (alpha, alpha + 1), each of which only tells whether
+    the value is above or below a guess. Every search moves the guess to the bound it found, so
+    the bounds close in on the value until they meet.
+
+    Null window searches prune much more than full window ones, and the transposition table
+    remembers the bounds found by earlier searches, so the searches after the first one are
+    cheap. The player deepens iteratively, and the first guess at each depth is the value found
+    at the depth before, which is usually close.
+
+    Instance Attributes:
+     - passes: the number of null window searches made on the last call to make_move
+
+    >>> player = MTDFPlayer(5, 8, use_book=False)
+    >>> player.stop()
+    >>> player.make_move(ReversiGame(), (-1, -1))
+    Traceback (most recent call last):
+    ...
+    ai_players._SearchTimeout
+    >>> player.resume()
+    >>> player.depth
+    5
+    """
+    passes: int
+
+    def __init__(self, depth: int, board_size: int, table_memory_mb: float = 16.0,
+                 move_ordering: bool = True, endgame_empties: int = 10,
+                 use_book: bool = True) -> None:
+        """Initialize the player.
+
+        Preconditions:
+            - table_memory_mb > 0
+        """
+        super().__init__(depth, board_size, table_memory_mb, move_ordering,
+                         endgame_empties=endgame_empties, use_book=use_book)
+        self.passes = 0
+
+    def make_move(self, game: ReversiGame, previous_move: tuple[int, int]) -> tuple[int, int]:
+        known_move = self._get_known_move(game)
+        if known_move is not None:
+            return known_move
+        self.nodes_searched = 0
+        self.passes = 0
+        if self.move_orderer is not None:
+            self.move_orderer.new_search()
+        game.set_heuristic(self.heuristic_list)
+
+        target_depth = self.depth
+        guess = 0
+        best_move = None
+        try:
+            for depth in range(1, target_depth + 1):
+                self.depth = depth
+                guess, best_move = self._mtdf(game, guess)
+        finally:
+            # restore the depth even if the search was stopped
+            self.depth = target_depth
+
+        sign = 1 if game.get_current_player() == -1 else -1
+        self.evaluation = sign * guess
+        self.principal_variation = self._get_principal_variation(game, best_move)
+        return best_move
+
+    def _mtdf(self, game: ReversiGame, guess: float) -> tuple[float, tuple[int, int]]:
+        """Return the value of game (from the point of view of the player to move) searched to
+        self.depth, and the best move, starting from the guess of the value.
+
+        Preconditions:
+            - game.get_winner() is None
+        """
+        lower = float('-inf')
+        upper = float('inf')
+        value = guess
+        best_move = None
+        while lower < upper:
+            beta = max(value, lower + 1)
+            value, move = self._principal_variation_search(game, 0, beta - 1, beta)
+            self.passes += 1
+            if value < beta:
+                upper = value
+            else:
+                # the move proves that the value is at least value, so once the bounds meet,
+                # the move of the last search that failed high is a best move
+                lower = value
+                best_move = move
+        return value, best_move
+
+
+class TimedMinimaxABPlayer(MinimaxABPlayer):
+    """
+    TimedMinimaxABPlayer is a MinimaxABPlayer that is given an amount of time per move instead
+    of a fixed depth. It searches to depth 1, then depth 2, and so on (iterative deepening), and
+    plays the best move of the deepest search that finished before the time ran out. The
+    transposition table makes each search try the previous search's best move first.
+
+    Each search after the first uses an aspiration window: as the value at one depth is usually
+    close to the value at the depth before, the search starts with a narrow window around the
+    previous value, which prunes more than the full window. If the value turns out to be outside
+    the window (the search fails low or high), the window is widened on that side and the
+    search is repeated.
+
+    Instance Attributes:
+     - time_limit: the number of seconds the player may spend on each move
+     - max_depth: the deepest search the player will start
+     - completed_depth: the depth of the deepest search that finished on the last move
+     - aspiration_width: the distance from the previous value to each side of the first
+                         window, or 0 if aspiration windows are not used
+     - aspiration_growth: the number the distance is multiplied by every time the search fails
+                          low or high (float('inf') opens the window fully on that side)
+     - aspiration_searches: the number of searches that started with an aspiration window
+     - fail_lows: the number of times the value was below the window and the search was
+                  repeated
+     - fail_highs: the number of times the value was above the window and the search was
+                   repeated
+
+     Representation Invariant:
+      - self.time_limit > 0
+      - self.max_depth > 0
+      - self.transposition_table is not None
+      - self.aspiration_width >= 0
+      - self.aspiration_growth > 1
+    """
+    time_limit: float
+    max_depth: int
+    completed_depth: int
+    aspiration_width: float
+    aspiration_growth: float
+    aspiration_searches: int
+    fail_lows: int
+    fail_highs: int
+
+    # Private Instance Attributes:
+    # - _deadline: the time.perf_counter() value at which the current search must stop
+
+    _deadline: float
+
+    def __init__(self, time_limit: float, board_size: int, max_depth: int = 64,
+                 table_memory_mb: float = 16.0, endgame_empties: int = 10,
+                 aspiration_width: float = 10, aspiration_growth: float = 4) -> None:
+        """Initialize the player.
+
+        Preconditions:
+            - table_memory_mb > 0
+        """
+        super().__init__(1, board_size, table_memory_mb, endgame_empties=endgame_empties)
+        self.time_limit = time_limit
+        self.max_depth = max_depth
+        self.completed_depth = 0
+        self.aspiration_width = aspiration_width
+        self.aspiration_growth = aspiration_growth
+        self.aspiration_searches = 0
+        self.fail_lows = 0
+        self.fail_highs = 0
+        self._deadline = float('inf')
+
+    def make_move(self, game: ReversiGame, previous_move: tuple[int, int]) -> tuple[int, int]:
+        start_time = time.perf_counter()
+        known_move = self._get_known_move(game)
+        if known_move is not None:
+            return known_move
+        self.nodes_searched = 0
+        if self.move_orderer is not None:
+            self.move_orderer.new_search()
+        # search a copy so that a search stopped halfway does not leave moves on the game
+        search_game = game.copy()
+        best_move = None
+        self.completed_depth = 0
+        value = 0
+        # depth 1 is always finished, so that there is a move to return
+        self._deadline = float('inf')
+        for depth in range(1, self.max_depth + 1):
+            self.depth = depth
+            try:
+                if depth == 1 or self.aspiration_width == 0:
+                    best_move = self._search_root(search_game, previous_move)
+                else:
+                    best_move = self._aspiration_search(search_game, previous_move, value)
+            except _SearchTimeout:
+                if self._stop_requested:
+                    raise
+                break
+            value = self.evaluation
+            self.completed_depth = depth
+            if depth == 1:
+                self._deadline = start_time + self.time_limit
+            if time.perf_counter() >= self._deadline:
+                break
+        self.depth = self.completed_depth
+        self.evaluation = value
+        self.principal_variation = self._get_principal_variation(game, best_move)
+        return best_move
+
+    def get_research_rate(self) -> float:
+        """Return the average number of times a search with an aspiration window had to be
+        repeated so far."""
+        if self.aspiration_searches == 0:
+            return 0.0
+        return (self.fail_lows + self.fail_highs) / self.aspiration_searches
+
+    def _aspiration_search(self, game: ReversiGame, previous_move: tuple[int, int],
+                           guess: float) -> tuple[int, int]:
+        """Search game to self.depth with an aspiration window around guess, widening it until
+        the value is inside it, and return the best move.
+
+        Preconditions:
+            - game.get_winner() is None
+        """
+        self.aspiration_searches += 1
+        width = self.aspiration_width
+        alpha = guess - width
+        beta = guess + width
+        while True:
+            best_move = self._search_root(game, previous_move, alpha, beta)
+            if alpha < self.evaluation < beta:
+                return best_move
+            width *= self.aspiration_growth
+            if self.evaluation <= alpha:
+                self.fail_lows += 1
+                alpha = self.evaluation - width
+            else:
+                self.fail_highs += 1
+                beta = self.evaluation + width
+
+    def _minimax(self, game: ReversiGame, depth: int, alpha: float, beta: float,
+                 tree: Optional[GameTree]) -> tuple[float, Optional[tuple[int, int]]]:
+        """
+        MinimaxABPlayer._minimax that raises _SearchTimeout once the time for the move has
+        run out.
+        """
+        if time.perf_counter() >= self._deadline:
+            raise _SearchTimeout
+        return super()._minimax(game, depth, alpha, beta, tree)
+
+
+class ParallelMinimaxABPlayer(MinimaxABPlayer):
+    """
+    ParallelMinimaxABPlayer is a MinimaxABPlayer that splits the search at the root over a pool
+    of worker processes: every move of the current position is searched by one of the workers.
+
+    The first move (in move ordering order) is searched on its own first, so that the other
+    moves are searched with its value as a bound (as in Young Brothers Wait). The best value
+    found so far is shared between the workers, which start every search with it as their
+    bound. The bound is relaxed by 1 so that a move as good as the best one so far still gets
+    its exact value (the evaluations are integers), and the chosen move is the first move in
+    the root order with the best value, just like in MinimaxABPlayer. This makes the choice
+    independent of the order the workers finish in, so for a fixed random seed it is the same
+    move that a new MinimaxABPlayer of the same depth would choose.
+
+    Each worker process keeps its own transposition table and move orderer between searches.
+
+    Instance Attributes:
+     - workers: the number of worker processes
+     - table_memory_mb: the size of the transposition table of each worker, in megabytes
+
+     Representation Invariant:
+      - self.workers > 0
+      - self.transposition_table is None
+    """
+    workers: int
+    table_memory_mb: float
+
+    # Private Instance Attributes:
+    # - _executor: the pool of worker processes, created on the first search
+    # - _bound: the best value found so far in the current search, from the point of view of
+    #           the player to move (i.e. negated when black is to move), shared with the workers
+
+    _executor: Optional[ProcessPoolExecutor]
+    _bound: Any
+
+    def __init__(self, depth: int, board_size: int, workers: int = 4,
+                 table_memory_mb: float = 16.0, move_ordering: bool = True,
+                 endgame_empties: int = 10) -> None:
+        # the root is only ordered here, so only the workers need transposition tables
+        super().__init__(depth, board_size, 0, move_ordering, endgame_empties=endgame_empties)
+        self.workers = workers
+        self.table_memory_mb = table_memory_mb
+        self._executor = None
+        self._bound = multiprocessing.Value('d', float('-inf'))
+
+    def make_move(self, game: ReversiGame, previous_move: tuple[int, int]) -> tuple[int, int]:
+        known_move = self._get_known_move(game)
+        if known_move is not None:
+            return known_move
+        self.nodes_searched = 1
+        self.last_tree = None
+        if self.move_orderer is not None:
+            self.move_orderer.new_search()
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(self.workers, initializer=_init_worker,
+                                                 initargs=(self._bound,))
+
+        possible_moves = list(game.get_valid_moves())
+        if self.move_orderer is not None:
+            possible_moves = self.move_orderer.order_moves(possible_moves, 0, None)
+        else:
+            random.shuffle(possible_moves)
+
+        config = (self.depth, game.get_board().size, self.table_memory_mb,
+                  self.move_orderer is not None)
+        position = game.copy()
+        self._bound.value = float('-inf')
+        # search the first move on its own, to get a bound for the other moves
+        results = {possible_moves[0]: self._executor.submit(
+            _search_move, config, position, possible_moves[0]).result()}
+        futures = [self._executor.submit(_search_move, config, position, move)
+                   for move in possible_moves[1:]]
+        for future in as_completed(futures):
+            move, value, nodes, variation = future.result()
+            results[move] = (move, value, nodes, variation)
+
+        best_move = None
+        best_value = float('-inf')
+        for move in possible_moves:
+            _, value, nodes, variation = results[move]
+            self.nodes_searched += nodes
+            # the values are from the point of view of the player to move
+            if value > best_value:
+                best_value = value
+                best_move = move
+                self.principal_variation = variation
+        self.evaluation = best_value if game.get_current_player() == -1 else -best_value
+        return best_move
+
+    def shutdown(self) -> None:
+        """Stop the worker processes. They are started again by the next call to make_move."""
+        if self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
+
+
+# The shared bound of the worker process, and the MinimaxABPlayer it searches with for every
+# (depth, board size, table memory, move ordering) configuration it has been given.
+_WORKER_BOUND: Any = None
+_WORKER_PLAYERS: dict[tuple[int, int, float, bool], MinimaxABPlayer] = {}
+
+
+def _init_worker(bound: Any) -> None:
+    """Initialize a ParallelMinimaxABPlayer worker process."""
+    global _WORKER_BOUND
+    _WORKER_BOUND = bound
+
+
+def _search_move(config: tuple[int, int, float, bool], game: ReversiGame,
+                 move: tuple[int, int]) -> tuple[tuple[int, int], float, int,
+                                                 list[tuple[int, int]]]:
+    """Search move in game in a worker process, and return the move, its value from the point
+    of view of the player making it, the number of positions searched and the principal
+    variation starting with move.
+
+    The value is exact if it is at least the shared bound at the start of the search, and
+    otherwise it is only known to be less than the bound.
+    """
+    if config not in _WORKER_PLAYERS:
+        _WORKER_PLAYERS[config] = MinimaxABPlayer(config[0], config[1], config[2], config[3])
+    # relax the bound by 1 so that a move as good as the best one gets an exact value
+    value, nodes, variation = _WORKER_PLAYERS[config].search_root_move(
+        game, move, _WORKER_BOUND.value - 1)
+
+    with _WORKER_BOUND.get_lock():
+        _WORKER_BOUND.value = max(_WORKER_BOUND.value, value)
+    return move, value, nodes, variation
+
+
+def _add_subtree(tree: Optional[GameTree], move: tuple[int, int],
+                 game: ReversiGame) -> Optional[GameTree]:
+    """Add a subtree for move to tree and return it, or return None if tree is None.
+
+    Preconditions:
+        - move has just been made in game
+    """
+    if tree is None:
+        return None
+    subtree = GameTree(move=move, is_white_move=game.get_current_player() == -1)
+    tree.add_subtree(subtree)
+    return subtree
+
+
+def make_player(name: str, board_size: int) -> Player:
+    """
+    make_player returns a new player described by name, for a board_size by board_size board.
+    The names are the ones shown in the AI dropdowns: 'Random Moves', 'Minimax <depth>',
+    'PVS <depth>' and 'Timed <seconds>s', and also 'MTD(f) <depth>'.
+
+    Raise ValueError if name is not one of these.
+
+    >>> make_player('PVS 4', 8).depth
+    4
+    >>> make_player('Timed 0.5s', 8).time_limit
+    0.5
+    >>> make_player('minimax 4', 8)
+    Traceback (most recent call last):
+    ...
+    ValueError: Unknown player "minimax 4"
+    """
+    if name.startswith('Minimax '):
+        return MinimaxABPlayer(int(name.split('Minimax ')[-1]), board_size)
+    elif name.startswith('PVS '):
+        return PVSPlayer(int(name.split('PVS ')[-1]), board_size)
+    elif name.startswith('MTD(f) '):
+        return MTDFPlayer(int(name.split('MTD(f) ')[-1]), board_size)
+    elif name.startswith('Timed '):
+        return TimedMinimaxABPlayer(float(name.split('Timed ')[-1].rstrip('s')), board_size)
+    elif name == 'Random Moves':
+        return RandomPlayer()
+    else:
+        raise ValueError(f'Unknown player "{name}"')
 
 
 def test_players(player1: Player, player2: Player, iterations: int) -> None:
@@ -317,11 +1172,147 @@ def check_same(player1: Player, player2: Player) -> None:
         prev_move = move1
 
 
+def compare_node_counts(player1: MinimaxABPlayer, player2: MinimaxABPlayer, board_size: int,
+                        num_moves: int) -> None:
+    """
+    compare_node_counts plays num_moves random moves on a board_size by board_size board, and
+    prints the number of positions each player searches to choose a move in every position along
+    the way. This is useful for measuring how much a search improvement prunes.
+    """
+    game = ReversiGame()
+    game.set_board_size(board_size)
+    game.start_game()
+    total1 = 0
+    total2 = 0
+    for _ in range(num_moves):
+        if game.get_winner() is not None:
+            break
+        player1.make_move(game, (-1, -1))
+        player2.make_move(game, (-1, -1))
+        print("Player 1 nodes: ", player1.nodes_searched,
+              "  Player 2 nodes: ", player2.nodes_searched)
+        total1 += player1.nodes_searched
+        total2 += player2.nodes_searched
+        game.make_move(random.choice(list(game.get_valid_moves())))
+    print("Player 1 total nodes: " + str(total1))
+    print("Player 2 total nodes: " + str(total2))
+
+
+def compare_mtdf(depth: int, board_size: int, num_moves: int) -> None:
+    """
+    compare_mtdf plays num_moves random moves on a board_size by board_size board, and prints
+    the number of positions a MinimaxABPlayer and an MTDFPlayer of the given depth search to
+    choose a move in every position along the way, and the number of null window searches the
+    MTDFPlayer makes.
+    """
+    player1 = MinimaxABPlayer(depth, board_size, endgame_empties=0, use_book=False)
+    player2 = MTDFPlayer(depth, board_size, endgame_empties=0, use_book=False)
+    game = ReversiGame()
+    game.set_board_size(board_size)
+    game.start_game()
+    total1 = 0
+    total2 = 0
+    total_passes = 0
+    for _ in range(num_moves):
+        if game.get_winner() is not None:
+            break
+        player1.make_move(game, (-1, -1))
+        player2.make_move(game, (-1, -1))
+        print("Minimax nodes: ", player1.nodes_searched, "  MTD(f) nodes: ",
+              player2.nodes_searched, "  MTD(f) passes: ", player2.passes)
+        total1 += player1.nodes_searched
+        total2 += player2.nodes_searched
+        total_passes += player2.passes
+        game.make_move(random.choice(list(game.get_valid_moves())))
+    print("Minimax total nodes: " + str(total1))
+    print("MTD(f) total nodes: " + str(total2) + ", total passes: " + str(total_passes))
+
+
+def compare_parallel_speedup(depth: int, board_size: int, num_moves: int,
+                             worker_counts: list[int]) -> None:
+    """
+    compare_parallel_speedup plays num_moves random moves on a board_size by board_size board,
+    and prints how long a MinimaxABPlayer and a ParallelMinimaxABPlayer with each number of
+    workers in worker_counts take to choose a move in every position along the way, and the
+    speedup of each ParallelMinimaxABPlayer over the MinimaxABPlayer. The random seed is reset
+    for every position, so the players must all choose the same move.
+    """
+    game = ReversiGame()
+    game.set_board_size(board_size)
+    game.start_game()
+    positions = []
+    for _ in range(num_moves):
+        if game.get_winner() is not None:
+            break
+        positions.append(game.copy())
+        game.make_move(random.choice(list(game.get_valid_moves())))
+
+    moves = []
+    start_time = time.perf_counter()
+    for i, position in enumerate(positions):
+        random.seed(i)
+        moves.append(MinimaxABPlayer(depth, board_size).make_move(position, (-1, -1)))
+    sequential_time = time.perf_counter() - start_time
+    print("1 process: --- %s seconds ---" % sequential_time)
+
+    for workers in worker_counts:
+        player = ParallelMinimaxABPlayer(depth, board_size, workers)
+        # start the worker processes before timing
+        player.make_move(positions[0], (-1, -1))
+        parallel_time = 0
+        for i, position in enumerate(positions):
+            random.seed(i)
+            start_time = time.perf_counter()
+            move = player.make_move(position, (-1, -1))
+            parallel_time += time.perf_counter() - start_time
+            assert move == moves[i]
+        player.shutdown()
+        print(str(workers) + " workers: --- %s seconds ---" % parallel_time,
+              "  speedup: " + str(round(sequential_time / parallel_time, 2)))
+
+
+def build_opening_book(board_size: int, plies: int, depth: int) -> None:
+    """
+    build_opening_book searches every position that can be reached in fewer than plies moves
+    from the start of a game on a board_size by board_size board with a MinimaxABPlayer of the
+    given depth, and writes the best moves to the opening book for the size. Symmetric positions
+    are only searched once.
+
+    The book is used by every MinimaxABPlayer created afterwards with use_book=True.
+    """
+    random.seed(0)
+    player = MinimaxABPlayer(depth, board_size, endgame_empties=0, use_book=False)
+    game = ReversiGame()
+    game.set_board_size(board_size)
+    game.start_game()
+    records = {}
+    positions = [game]
+    start_time = time.time()
+    for ply in range(plies):
+        next_positions = []
+        for position in positions:
+            key, transform = position.get_canonical_hash()
+            if position.get_winner() is not None or key in records:
+                continue
+            move = player.make_move(position, (-1, -1))
+            row, column = position.transform_move(move, transform)
+            records[key] = (row * board_size + column, int(player.evaluation))
+            for next_move in position.get_valid_moves():
+                next_positions.append(position.copy_and_make_move(next_move))
+        positions = next_positions
+        print("Ply " + str(ply) + ": " + str(len(records)) + " positions, "
+              + "--- %s seconds ---" % (time.time() - start_time))
+    write_book(get_book_path(board_size), board_size, records)
+
+
 if __name__ == "__main__":
     import python_ta
     python_ta.check_all(config={
-        'extra-imports': ['random', 'time', 'reversi', 'game_tree'],
-        'allowed-io': ['check_same', 'test_players'],
+        'extra-imports': ['random', 'time', 'typing', 'multiprocessing', 'concurrent.futures',
+                          'bitboard', 'reversi', 'game_tree', 'transposition', 'move_ordering',
+                          'endgame', 'opening_book'],
+        'allowed-io': ['check_same', 'test_players', 'compare_node_counts',
+                       'compare_parallel_speedup', 'build_opening_book', 'compare_mtdf'],
         'max-line-length': 100,
         'disable': ['E1136', 'R1702', 'R0913']
     })
@@ -0,0 +1,368 @@
+"""
+bitboard.py:
+Contains the BitboardEngine class, used by ReversiGame for fast move generation.
+CSC111 Final Project by Anatoly Zavyalov, Baker Jackson, Elliot Schrider, Rachel Kim
+
+Copyright 2021 Anatoly Zavyalov, Baker Jackson, Elliot Schrider, Rachel Kim
+
+Permission is hereby granted, free of charge, to any person obtaining a copy of this software and
+associated documentation files (the "Software"), to deal in the Software without restriction,
+including without limitation the rights to use, copy, modify, merge, publish, distribute,
+sublicense, and/or sell copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all copies or substantial
+portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR IMPLIED, INCLUDING BUT
+NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND
+NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM,
+DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+"""
+
+import random
+from typing import Dict, List, Set, Tuple
+
+# The number of symmetries of a square board: the 4 rotations, and the 4 reflections (in the
+# vertical and horizontal middle lines and in the two diagonals).
+NUM_TRANSFORMS = 8
+
+# INVERSE_TRANSFORMS[t] is the transform that undoes transform t.
+INVERSE_TRANSFORMS = (0, 3, 2, 1, 4, 5, 6, 7)
+
+# The number of bits in a Zobrist hash, and the mask of those bits.
+HASH_BITS = 64
+HASH_MASK = (1 << HASH_BITS) - 1
+
+
+class BitboardEngine:
+    """A bitboard move generator for a <size> by <size> board.
+
+    A bitboard is an int where bit (row * size + column) is set if the square [row][column]
+    holds a piece. A position is stored as two bitboards, one for each player. Python ints have
+    arbitrary precision, so the same code works for every board size; the edge masks and the
+    shift amounts of each direction are precomputed once per size.
+
+    The engine also holds the Zobrist keys used to hash positions of this size. The keys are
+    generated from a generator seeded with the size, so the hash of a position is the same every
+    time the program is run.
+
+    The hashes of all the symmetries of a position (see transform_square) can be kept together
+    in one int of NUM_TRANSFORMS * HASH_BITS bits, where bits t * HASH_BITS to
+    (t + 1) * HASH_BITS - 1 hold the hash of the position moved by transform t. The symmetric
+    keys are packed the same way, so a single xor updates all the hashes at once.
+
+    Instance Attributes:
+     - size: the size of the board (in squares)
+     - full: the bitboard with every square of the board set
+     - black_keys: black_keys[i] is the Zobrist key of a black piece on bit i
+     - white_keys: white_keys[i] is the Zobrist key of a white piece on bit i
+     - white_to_move_key: the Zobrist key included in the hash when white is to move
+     - symmetric_black_keys: symmetric_black_keys[i] is the packed symmetric key of a black
+                             piece on bit i
+     - symmetric_white_keys: symmetric_white_keys[i] is the packed symmetric key of a white
+                             piece on bit i
+     - symmetric_white_to_move_key: the packed symmetric key included when white is to move
+
+    Representation Invariants:
+     - self.size >= 2
+
+    >>> engine = BitboardEngine(8)
+    >>> black = engine.square_to_bit(3, 3) | engine.square_to_bit(4, 4)
+    >>> white = engine.square_to_bit(3, 4) | engine.square_to_bit(4, 3)
+    >>> engine.bits_to_squares(engine.get_moves(black, white)) == {(2, 4), (3, 5), (4, 2), (5, 3)}
+    True
+    >>> engine.bits_to_squares(engine.get_flips(black, white, engine.square_to_bit(2, 4)))
+    {(3, 4)}
+    """
+
+    size: int
+    full: int
+    black_keys: List[int]
+    white_keys: List[int]
+    white_to_move_key: int
+    symmetric_black_keys: List[int]
+    symmetric_white_keys: List[int]
+    symmetric_white_to_move_key: int
+
+    # Private Instance Attributes:
+    # - _squares: _squares[i] is the (row, column) square of bit i
+    # - _left_directions: the directions that move bits left, as tuples (shift, mask, steps).
+    #                     The mask removes the bits that wrapped around onto the next row, and
+    #                     steps are the (previous shift, shift) pairs of the Kogge-Stone fill
+    #                     after its first step.
+    # - _right_directions: the directions that move bits right, stored like _left_directions
+    # - _symmetric_flip_keys: _symmetric_flip_keys[i] is the change in the packed symmetric
+    #                         hashes when the piece on bit i is flipped
+    # - _transforms: _transforms[t][i] is the bit that bit i is moved to by transform t
+
+    _squares: List[Tuple[int, int]]
+    _symmetric_flip_keys: List[int]
+    _transforms: List[List[int]]
+    _left_directions: Tuple[Tuple[int, int, Tuple[Tuple[int, int], ...]], ...]
+    _right_directions: Tuple[Tuple[int, int, Tuple[Tuple[int, int], ...]], ...]
+
+    def __init__(self, size: int) -> None:
+        """Precompute the masks and shift amounts for a <size> by <size> board."""
+        self.size = size
+        self.full = (1 << (size * size)) - 1
+        self._squares = [divmod(index, size) for index in range(size * size)]
+
+        column_0 = sum(1 << (row * size) for row in range(size))
+        not_first_column = self.full & ~column_0
+        not_last_column = self.full & ~(column_0 << (size - 1))
+
+        # A run of opponent pieces is at most size - 2 squares long, and a fill with k steps
+        # covers runs of up to 2 ** k - 1 squares.
+        num_steps = 1
+        while 2 ** num_steps - 1 < size - 2:
+            num_steps += 1
+
+        self._left_directions = (
+            _direction(1, not_first_column, num_steps),  # east
+            _direction(size, self.full, num_steps),  # south
+            _direction(size + 1, not_first_column, num_steps),  # south-east
+            _direction(size - 1, not_last_column, num_steps)  # south-west
+        )
+        self._right_directions = (
+            _direction(1, not_last_column, num_steps),  # west
+            _direction(size, self.full, num_steps),  # north
+            _direction(size - 1, not_first_column, num_steps),  # north-east
+            _direction(size + 1, not_last_column, num_steps)  # north-west
+        )
+
+        generator = random.Random(size)
+        self.black_keys = [generator.getrandbits(64) for _ in range(size * size)]
+        self.white_keys = [generator.getrandbits(64) for _ in range(size * size)]
+        self.white_to_move_key = generator.getrandbits(64)
+
+        self._transforms = [[0] * (size * size) for _ in range(NUM_TRANSFORMS)]
+        for index in range(size * size):
+            for transform in range(NUM_TRANSFORMS):
+                row, column = self.transform_square(index // size, index % size, transform)
+                self._transforms[transform][index] = row * size + column
+
+        self.symmetric_black_keys = [self._pack_keys(self.black_keys, index)
+                                     for index in range(size * size)]
+        self.symmetric_white_keys = [self._pack_keys(self.white_keys, index)
+                                     for index in range(size * size)]
+        self.symmetric_white_to_move_key = sum(self.white_to_move_key << (transform * HASH_BITS)
+                                               for transform in range(NUM_TRANSFORMS))
+        self._symmetric_flip_keys = [black_key ^ white_key for black_key, white_key
+                                     in zip(self.symmetric_black_keys, self.symmetric_white_keys)]
+
+    def square_to_bit(self, row: int, column: int) -> int:
+        """Return the bitboard containing only the square [row][column]."""
+        return 1 << (row * self.size + column)
+
+    def transform_square(self, row: int, column: int, transform: int) -> Tuple[int, int]:
+        """Return the square that [row][column] is moved to by the symmetry <transform> of the
+        board: 0 is the identity, 1 to 3 rotate the board by 90, 180 and 270 degrees clockwise,
+        and 4 to 7 reflect it in its vertical middle line, its horizontal middle line, its main
+        diagonal and its other diagonal.
+
+        Preconditions:
+         - 0 <= transform < NUM_TRANSFORMS
+
+        >>> engine = BitboardEngine(8)
+        >>> [engine.transform_square(0, 1, transform) for transform in range(NUM_TRANSFORMS)]
+        [(0, 1), (1, 7), (7, 6), (6, 0), (0, 6), (7, 1), (1, 0), (6, 7)]
+        >>> all(engine.transform_square(*engine.transform_square(2, 5, t), INVERSE_TRANSFORMS[t])
+        ...     == (2, 5) for t in range(NUM_TRANSFORMS))
+        True
+        """
+        last = self.size - 1
+        return ((row, column), (column, last - row), (last - row, last - column),
+                (last - column, row), (row, last - column), (last - row, column),
+                (column, row), (last - column, last - row))[transform]
+
+    def bits_to_squares(self, bits: int) -> Set[Tuple[int, int]]:
+        """Return the set of (row, column) squares set in <bits>."""
+        squares = set()
+        while bits:
+            lowest = bits & -bits
+            squares.add(self._squares[lowest.bit_length() - 1])
+            bits ^= lowest
+        return squares
+
+    def get_symmetric_hashes(self, black: int, white: int, current_player: int) -> int:
+        """Return the packed Zobrist hashes of all the symmetries of the position with the given
+        pieces and player to move.
+
+        Preconditions:
+         - current_player in {1, -1}
+
+        >>> engine = BitboardEngine(8)
+        >>> hashes = engine.get_symmetric_hashes(engine.square_to_bit(0, 1),
+        ...                                      engine.square_to_bit(2, 2), 1)
+        >>> rotated = engine.get_symmetric_hashes(
+        ...     engine.square_to_bit(*engine.transform_square(0, 1, 1)),
+        ...     engine.square_to_bit(*engine.transform_square(2, 2, 1)), 1)
+        >>> get_transformed_hash(hashes, 1) == get_transformed_hash(rotated, 0)
+        True
+        >>> get_transformed_hash(hashes, 0) == get_transformed_hash(rotated, 0)
+        False
+        """
+        hashes = self.symmetric_white_to_move_key if current_player == -1 else 0
+        for index in range(self.size * self.size):
+            if black >> index & 1:
+                hashes ^= self.symmetric_black_keys[index]
+            elif white >> index & 1:
+                hashes ^= self.symmetric_white_keys[index]
+        return hashes
+
+    def get_symmetric_flips_hash(self, flips: int) -> int:
+        """Return the change in the packed symmetric hashes when the pieces in <flips> are
+        flipped."""
+        flips_hash = 0
+        while flips:
+            lowest = flips & -flips
+            flips_hash ^= self._symmetric_flip_keys[lowest.bit_length() - 1]
+            flips ^= lowest
+        return flips_hash
+
+    def _pack_keys(self, keys: List[int], index: int) -> int:
+        """Return the packed symmetric key of bit <index>, where keys[i] is the key of bit i."""
+        return sum(keys[self._transforms[transform][index]] << (transform * HASH_BITS)
+                   for transform in range(NUM_TRANSFORMS))
+
+    def pieces_to_bitboards(self, pieces: List[List[int]]) -> Tuple[int, int]:
+        """Return the (black, white) bitboards of a list of pieces.
+
+        Preconditions:
+         - pieces is a self.size by self.size 2-d list of integers in {-1, 0, 1}
+        """
+        black = 0
+        white = 0
+        for row in range(self.size):
+            for column in range(self.size):
+                if pieces[row][column] == 1:
+                    black |= 1 << (row * self.size + column)
+                elif pieces[row][column] == -1:
+                    white |= 1 << (row * self.size + column)
+        return black, white
+
+    def get_moves(self, own: int, opponent: int) -> int:
+        """Return the bitboard of valid moves for the player whose pieces are <own>.
+
+        For every direction, the runs of opponent pieces that start next to one of the player's
+        pieces are found with a Kogge-Stone parallel prefix fill, and the empty squares right
+        after those runs are valid moves.
+        """
+        moves = 0
+
+        for shift, mask, steps in self._left_directions:
+            pro = opponent & mask
+            gen = own | (pro & (own << shift))
+            for previous, step in steps:
+                pro &= pro << previous
+                gen |= pro & (gen << step)
+            moves |= ((gen & opponent) << shift) & mask
+
+        for shift, mask, steps in self._right_directions:
+            pro = opponent & mask
+            gen = own | (pro & (own >> shift))
+            for previous, step in steps:
+                pro &= pro >> previous
+                gen |= pro & (gen >> step)
+            moves |= ((gen & opponent) >> shift) & mask
+
+        return moves & ~(own | opponent)
+
+    def get_flips(self, own: int, opponent: int, move: int) -> int:
+        """Return the bitboard of the opponent's pieces that are flipped when the player whose
+        pieces are <own> plays the single square in <move>.
+
+        The flips are found by casting a ray outwards from <move> in every direction, so the
+        cost is proportional to the number of pieces walked over rather than to the board size:
+        a run of opponent pieces is flipped if the square right after it belongs to the player.
+        """
+        flips = 0
+
+        for shift, mask, _ in self._left_directions:
+            square = (move << shift) & mask
+            run = 0
+            while square & opponent:
+                run |= square
+                square = (square << shift) & mask
+            if square & own:
+                flips |= run
+
+        for shift, mask, _ in self._right_directions:
+            square = (move >> shift) & mask
+            run = 0
+            while square & opponent:
+                run |= square
+                square = (square >> shift) & mask
+            if square & own:
+                flips |= run
+
+        return flips
+
+
+def _direction(shift: int, mask: int,
+               num_steps: int) -> Tuple[int, int, Tuple[Tuple[int, int], ...]]:
+    """Return the (shift, mask, steps) tuple of a direction for a fill with <num_steps> steps.
+
+    >>> _direction(1, 0, 3)
+    (1, 0, ((1, 2), (2, 4)))
+    """
+    return (shift, mask,
+            tuple((shift * 2 ** i, shift * 2 ** (i + 1)) for i in range(num_steps - 1)))
+
+
+# The engines that have been created so far, keyed by board size.
+_ENGINES: Dict[int, BitboardEngine] = {}
+
+
+def get_engine(size: int) -> BitboardEngine:
+    """Return the BitboardEngine for a <size> by <size> board, creating it the first time
+    it is needed.
+
+    >>> get_engine(16) is get_engine(16)
+    True
+    """
+    if size not in _ENGINES:
+        _ENGINES[size] = BitboardEngine(size)
+    return _ENGINES[size]
+
+
+def get_transformed_hash(hashes: int, transform: int) -> int:
+    """Return the hash of the position moved by <transform> from the packed symmetric hashes of
+    the position (see BitboardEngine.get_symmetric_hashes).
+
+    >>> get_transformed_hash(5 << HASH_BITS | 7, 1)
+    5
+    """
+    return hashes >> (transform * HASH_BITS) & HASH_MASK
+
+
+def count(bits: int) -> int:
+    """Return the number of squares set in <bits>.
+
+    >>> count(0b1011)
+    3
+    """
+    return bin(bits).count('1')
+
+
+if __name__ == "__main__":
+    # Test doctests
+    import doctest
+    doctest.testmod()
+
+    import python_ta.contracts
+
+    python_ta.contracts.check_all_contracts()
+
+    import python_ta
+    python_ta.check_all(config={
+        # the names (strs) of imported modules
+        'extra-imports': ['random'],
+        'allowed-io': [],  # the names (strs) of functions that call print/open/input
+        'max-line-length': 100,
+
+        # Disable too-many-nested-blocks, too-many-arguments
+        'disable': ['E1136', 'R1702', 'R0913']
+    })
@@ -21,6 +21,7 @@ DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE,
 OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
 """
 
+from __future__ import annotations
 from typing import List, Tuple, Set
 
 
@@ -129,6 +130,43 @@ class Board:
 
         self.pieces = board
 
+    def __str__(self) -> str:
+        """Return a text drawing of the board, with one line per row: 'X' is a black piece,
+        'O' is a white piece, '*' is a possible next move and '.' is an empty square.
+
+        >>> board = Board()
+        >>> board.set_size(4)
+        >>> board.create_board()
+        >>> board.set_piece(1, 1, 1)
+        >>> board.set_piece(1, 2, -1)
+        >>> board.set_valid_move(1, 3, True)
+        >>> print(board)
+        . . . .
+        . X O *
+        . . . .
+        . . . .
+        """
+        symbols = {0: '.', 1: 'X', -1: 'O'}
+        lines = []
+        for row in range(self.size):
+            line = [symbols[self.pieces[row][column]] for column in range(self.size)]
+            for column in range(self.size):
+                if line[column] == '.' and (row, column) in self.valid_moves:
+                    line[column] = '*'
+            lines.append(' '.join(line))
+        return '\n'.join(lines)
+
+    def copy(self) -> Board:
+        """Return a copy of this board. The rows of pieces and the set of valid moves are
+        copied, so the copy can be changed without changing this board."""
+
+        board_copy = Board.__new__(Board)
+        board_copy.size = self.size
+        board_copy._next_size = self._next_size
+        board_copy.pieces = [row[:] for row in self.pieces]
+        board_copy.valid_moves = set(self.valid_moves)
+        return board_copy
+
 
 if __name__ == "__main__":
     # Test doctests
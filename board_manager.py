@@ -21,8 +21,9 @@ DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE,
 OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
 """
 
-from typing import Tuple, Union
+from typing import Dict, List, Set, Tuple, Union
 import pygame
+import pygame.gfxdraw
 from window import Window
 from board import Board
 
@@ -44,8 +45,28 @@ class BoardManager:
     # - _PIECE_RADIUS_RATIO: The ratio of piece radius to square size
     # - _VALID_MOVE_RADIUS_RATIO: The ratio of the next move indicator radius to square size
     # - _PAUSED_OVERLAY_ALPHA: The transparency of the overlay rectangle when paused (max 255)
+    # - _board_surface: The board as it was last drawn
+    # - _grid_surface: The background and the lines of an empty board of size _drawn_size
+    # - _overlay_surface: The transparent rectangle drawn over the board when paused
+    # - _paused_text_surface: The 'GAME PAUSED' text drawn over the board when paused
+    # - _drawn_size: The size of the board drawn on _board_surface, or 0 if none was drawn
+    # - _drawn_pieces: The pieces drawn on _board_surface, in the same format as Board.pieces
+    # - _drawn_valid_moves: The squares with a next move indicator on _board_surface
+    # - _piece_sprites: The pre-rendered pieces for squares of a board of size _drawn_size,
+    #                   keyed by piece type (1 for black, -1 for white)
+    # - _valid_move_sprite: The pre-rendered next move indicator for squares of a board of
+    #                       size _drawn_size
 
     _window: Window
+    _board_surface: pygame.Surface
+    _grid_surface: pygame.Surface
+    _overlay_surface: pygame.Surface
+    _paused_text_surface: pygame.Surface
+    _drawn_size: int
+    _drawn_pieces: List[List[int]]
+    _drawn_valid_moves: Set[Tuple[int, int]]
+    _piece_sprites: Dict[int, pygame.Surface]
+    _valid_move_sprite: pygame.Surface
 
     _BG_COLORS: Tuple[pygame.Color, pygame.Color] = (pygame.Color(225, 174, 104),
                                                      pygame.Color(181, 136, 103))
@@ -65,66 +86,134 @@ class BoardManager:
 
         self._window = window
 
+        self._board_surface = pygame.Surface((self._BOARD_PIXEL_SIZE, self._BOARD_PIXEL_SIZE))
+        self._grid_surface = pygame.Surface((self._BOARD_PIXEL_SIZE, self._BOARD_PIXEL_SIZE))
+        self._overlay_surface = pygame.Surface((self._BOARD_PIXEL_SIZE, self._BOARD_PIXEL_SIZE))
+        self._overlay_surface.set_alpha(self._PAUSED_OVERLAY_ALPHA)
+        self._overlay_surface.fill((0, 0, 0))
+        self._paused_text_surface = self._window.render_text(text="GAME PAUSED")
+
+        self._drawn_size = 0
+        self._drawn_pieces = []
+        self._drawn_valid_moves = set()
+        self._piece_sprites = {}
+        self._valid_move_sprite = pygame.Surface((0, 0))
+
     def draw_board(self, board: Board, game_paused: bool) -> None:
-        """Create a pygame.Surface of the board, then draw it to self._window.
+        """Draw the board to self._window.
+
+        Only the squares whose piece or next move indicator changed since the last call are
+        redrawn onto self._board_surface, which is then drawn to the window.
 
         If game_paused is true, draw an overlay with text saying 'GAME PAUSED'"""
 
+        if board.size != self._drawn_size:
+            self._draw_grid(board.size)
+            self._render_sprites(board.size)
+
         # Size of each square in pixels.
         square_size = self._BOARD_PIXEL_SIZE / board.size
 
-        # Create an empty surface to draw onto
-        surface = pygame.Surface((self._BOARD_PIXEL_SIZE, self._BOARD_PIXEL_SIZE))
+        for (row, column) in self._get_changed_squares(board):
+            # Restore the background of the square from the grid, then draw its contents.
+            rect = self._get_square_rect(row, column, square_size)
+            self._board_surface.blit(self._grid_surface, rect, rect)
+
+            piece = board.pieces[row][column]
+            if piece != 0:  # Black or white
+                sprite = self._piece_sprites[piece]
+            elif (row, column) in board.valid_moves:  # Next move indicator
+                sprite = self._valid_move_sprite
+            else:
+                sprite = None
+
+            if sprite is not None:
+                # Centre the sprite on the square
+                self._board_surface.blit(
+                    sprite, (int(column * square_size + (square_size - sprite.get_width()) / 2),
+                             int(row * square_size + (square_size - sprite.get_height()) / 2)))
+
+            self._drawn_pieces[row][column] = piece
+
+        self._drawn_valid_moves = set(board.valid_moves)
+
+        self._window.draw_to_screen(self._board_surface, self._BOARD_POSITION)
+
+        # If the game is paused, draw the overlay along with text.
+        if game_paused:
+            self._window.draw_to_screen(self._overlay_surface, self._BOARD_POSITION)
+            text_position = (self._BOARD_POSITION[0] + self._BOARD_PIXEL_SIZE // 2 - 82,
+                             self._BOARD_POSITION[1] + self._BOARD_PIXEL_SIZE // 2 - 12)
+            self._window.draw_to_screen(self._paused_text_surface, text_position)
+
+    def _get_changed_squares(self, board: Board) -> Set[Tuple[int, int]]:
+        """Return the squares whose piece or next move indicator is different on board from
+        the last drawing.
+
+        Preconditions:
+         - board.size == self._drawn_size
+        """
+
+        changed = self._drawn_valid_moves.symmetric_difference(board.valid_moves)
+
+        for row in range(board.size):
+            pieces_row = board.pieces[row]
+            drawn_row = self._drawn_pieces[row]
+            if pieces_row != drawn_row:
+                for column in range(board.size):
+                    if pieces_row[column] != drawn_row[column]:
+                        changed.add((row, column))
+
+        return changed
+
+    def _draw_grid(self, size: int) -> None:
+        """Draw the background and the lines of an empty size by size board onto
+        self._grid_surface, and reset self._board_surface to it."""
+
+        # Size of each square in pixels.
+        square_size = self._BOARD_PIXEL_SIZE / size
 
         # Draw the main color of the board
-        pygame.draw.rect(surface, self._BG_COLORS[0],
+        pygame.draw.rect(self._grid_surface, self._BG_COLORS[0],
                          pygame.Rect(0, 0, self._BOARD_PIXEL_SIZE, self._BOARD_PIXEL_SIZE))
 
         # Draw the lines to separate the squares
-        for i in range(1, board.size):
+        for i in range(1, size):
             # Draw horizontal lines
-            pygame.draw.rect(surface, self._BG_COLORS[1],
+            pygame.draw.rect(self._grid_surface, self._BG_COLORS[1],
                              pygame.Rect(0, i * square_size - self._LINE_THICKNESS / 2,
                                          self._BOARD_PIXEL_SIZE, self._LINE_THICKNESS))
             # Draw vertical lines
-            pygame.draw.rect(surface, self._BG_COLORS[1],
+            pygame.draw.rect(self._grid_surface, self._BG_COLORS[1],
                              pygame.Rect(i * square_size - self._LINE_THICKNESS / 2, 0,
                                          self._LINE_THICKNESS, self._BOARD_PIXEL_SIZE))
 
-        # Draw pieces!
-        for row in range(board.size):
-            for column in range(board.size):
-                piece = board.get_piece(row=row, column=column)
-
-                if piece == 0:  # Empty piece
-                    continue
-                elif piece == 1:  # Black
-                    piece_color = self._PIECE_COLORS[0]
-                else:  # White
-                    # assert piece == -1
-                    piece_color = self._PIECE_COLORS[1]
-                pygame.draw.circle(surface, piece_color,
-                                   (column * square_size + square_size / 2,
-                                    row * square_size + square_size / 2),
-                                   square_size * self._PIECE_RADIUS_RATIO)
-
-        # Draw next move indicators.
-        for (row, column) in board.valid_moves:
-            pygame.draw.circle(surface, self._VALID_MOVE_COLOR,
-                               (column * square_size + square_size / 2,
-                                row * square_size + square_size / 2),
-                               square_size * self._VALID_MOVE_RADIUS_RATIO)
+        self._board_surface.blit(self._grid_surface, (0, 0))
+        self._drawn_size = size
+        self._drawn_pieces = [[0] * size for _ in range(size)]
+        self._drawn_valid_moves = set()
 
-        # If the game is paused, draw the overlay along with text.
-        if game_paused:
-            overlay = pygame.Surface((self._BOARD_PIXEL_SIZE, self._BOARD_PIXEL_SIZE))
-            overlay.set_alpha(self._PAUSED_OVERLAY_ALPHA)
-            overlay.fill((0, 0, 0))
-            surface.blit(overlay, (0, 0))
-            surface.blit(self._window.render_text(text="GAME PAUSED"),
-                         (self._BOARD_PIXEL_SIZE // 2 - 82, self._BOARD_PIXEL_SIZE // 2 - 12))
+    def _render_sprites(self, size: int) -> None:
+        """Render the anti-aliased pieces and next move indicator for a size by size board."""
 
-        self._window.draw_to_screen(surface, self._BOARD_POSITION)
+        # Size of each square in pixels.
+        square_size = self._BOARD_PIXEL_SIZE / size
+
+        self._piece_sprites = {
+            1: _render_circle(self._PIECE_COLORS[0], square_size * self._PIECE_RADIUS_RATIO),
+            -1: _render_circle(self._PIECE_COLORS[1], square_size * self._PIECE_RADIUS_RATIO)
+        }
+        self._valid_move_sprite = _render_circle(self._VALID_MOVE_COLOR,
+                                                 square_size * self._VALID_MOVE_RADIUS_RATIO)
+
+    def _get_square_rect(self, row: int, column: int, square_size: float) -> pygame.Rect:
+        """Return the rectangle of pixels covering the square at [row][column] of the board
+        surface, including the halves of the lines around it."""
+
+        left = int(column * square_size)
+        top = int(row * square_size)
+        return pygame.Rect(left, top, int((column + 1) * square_size) - left + 1,
+                           int((row + 1) * square_size) - top + 1)
 
     def check_mouse_press(self, position: Tuple[Union[int, float],
                                                 Union[int, float]],
@@ -147,6 +236,17 @@ class BoardManager:
                     int(pos[1] // square_size))
 
 
+def _render_circle(color: pygame.Color, radius: float) -> pygame.Surface:
+    """Return a transparent surface with an anti-aliased circle of the given colour and radius
+    (in pixels) in its centre."""
+
+    radius = int(radius)
+    sprite = pygame.Surface((2 * radius + 1, 2 * radius + 1), pygame.SRCALPHA)
+    pygame.gfxdraw.aacircle(sprite, radius, radius, radius, color)
+    pygame.gfxdraw.filled_circle(sprite, radius, radius, radius, color)
+    return sprite
+
+
 if __name__ == "__main__":
     # Test doctests
     import doctest
@@ -158,7 +258,7 @@ if __name__ == "__main__":
     import python_ta
     python_ta.check_all(config={
         # the names (strs) of imported modules
-        'extra-imports': ['pygame', 'window', 'board'],
+        'extra-imports': ['pygame', 'pygame.gfxdraw', 'window', 'board'],
         'allowed-io': [],  # the names (strs) of functions that call print/open/input
         'max-line-length': 100,
 
@@ -0,0 +1,301 @@
+"""
+endgame.py:
+Contains the EndgameSolver class, used by the AI players to play the end of the game perfectly.
+CSC111 Final Project by Anatoly Zavyalov, Baker Jackson, Elliot Schrider, Rachel Kim
+
+Copyright 2021 Anatoly Zavyalov, Baker Jackson, Elliot Schrider, Rachel Kim
+
+Permission is hereby granted, free of charge, to any person obtaining a copy of this software and
+associated documentation files (the "Software"), to deal in the Software without restriction,
+including without limitation the rights to use, copy, modify, merge, publish, distribute,
+sublicense, and/or sell copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all copies or substantial
+portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR IMPLIED, INCLUDING BUT
+NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND
+NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM,
+DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+"""
+
+import random
+import time
+from typing import List, Optional, Tuple
+
+import bitboard
+from reversi import ReversiGame
+
+# With more than this many empty squares, moves are ordered by the opponent's mobility after
+# the move (fastest-first). With fewer, counting the opponent's moves costs more than it saves,
+# and only parity is used.
+_FASTEST_FIRST_EMPTIES = 6
+
+
+class EndgameSolver:
+    """An exact solver for positions with few empty squares left.
+
+    The solver searches every line to the end of the game, following the rule that the game is
+    over as soon as the player to move has no valid moves, and scores the final position by the
+    difference in the number of pieces. It searches on the bitboards of the position with a
+    negamax alpha-beta search, and orders the moves so that:
+     - moves that leave the opponent with the fewest replies are searched first (fastest-first)
+     - moves in a region of the board (quadrant) with an odd number of empty squares are searched
+       before moves in a region with an even number of them (parity), as the player who moves
+       last in a region usually gains from it
+    Positions with 3 or fewer empty squares are solved by special routines that try the empty
+    squares directly, instead of generating and ordering the moves.
+
+    Instance Attributes:
+     - size: the size of the board (in squares)
+     - nodes_searched: the number of positions searched on the last call to solve
+     - positions_solved: the number of calls to solve so far
+     - solve_time: the total number of seconds spent in solve so far
+
+    >>> game = ReversiGame()
+    >>> game.set_board_size(4)
+    >>> game.start_game()
+    >>> game.start_game([[0, -1, -1, -1], [0, -1, -1, 1], [1, 1, -1, 0], [-1, -1, -1, 0]])
+    >>> EndgameSolver(4).solve(game)
+    (10, (2, 3))
+    """
+    size: int
+    nodes_searched: int
+    positions_solved: int
+    solve_time: float
+
+    # Private Instance Attributes:
+    # - _engine: the BitboardEngine for the size of the board
+    # - _regions: _regions[i] is the bitboard of the region (quadrant) containing bit i
+
+    _engine: bitboard.BitboardEngine
+    _regions: List[int]
+
+    def __init__(self, size: int) -> None:
+        self.size = size
+        self.nodes_searched = 0
+        self.positions_solved = 0
+        self.solve_time = 0.0
+        self._engine = bitboard.get_engine(size)
+
+        half = size // 2
+        quadrants = {}
+        for row in range(size):
+            for column in range(size):
+                quadrant = (row < half, column < half)
+                quadrants[quadrant] = quadrants.get(quadrant, 0) | 1 << (row * size + column)
+        self._regions = [quadrants[(index // size < half, index % size < half)]
+                         for index in range(size * size)]
+
+    def solve(self, game: ReversiGame) -> Tuple[int, Optional[Tuple[int, int]]]:
+        """Return the final number of white pieces minus the number of black pieces when both
+        players play perfectly from the position of game, and the best move for the player to
+        move (None if the game is over).
+
+        If several moves are best, the first one in the search order is returned, so the result
+        is always the same for the same position.
+
+        Preconditions:
+            - game.get_board().size == self.size
+        """
+        start_time = time.perf_counter()
+        self.nodes_searched = 1
+        black, white = game.get_bitboards()
+        if game.get_current_player() == 1:
+            own, opponent, sign = black, white, -1
+        else:
+            own, opponent, sign = white, black, 1
+
+        best_move = None
+        best_value = -self.size * self.size - 1
+        moves = self._engine.get_moves(own, opponent)
+        if moves == 0:
+            best_value = bitboard.count(own) - bitboard.count(opponent)
+        for move_bit, flips in self._order_moves(own, opponent, moves):
+            value = -self._solve(opponent ^ flips, own | flips | move_bit,
+                                 -self.size * self.size - 1, -best_value)
+            if value > best_value:
+                best_value = value
+                best_move = divmod(move_bit.bit_length() - 1, self.size)
+
+        self.positions_solved += 1
+        self.solve_time += time.perf_counter() - start_time
+        return sign * best_value, best_move
+
+    def get_positions_per_second(self) -> float:
+        """Return the number of positions solved per second of solving so far."""
+        if self.solve_time == 0:
+            return 0.0
+        return self.positions_solved / self.solve_time
+
+    def _solve(self, own: int, opponent: int, alpha: int, beta: int) -> int:
+        """Return the final number of pieces of the player to move minus the number of pieces of
+        the other player with perfect play, where own and opponent are the bitboards of their
+        pieces, or a bound on it if it is not between alpha and beta (fail-soft alpha-beta).
+        """
+        self.nodes_searched += 1
+        empties = self._engine.full & ~(own | opponent)
+        num_empties = bitboard.count(empties)
+        if num_empties <= 3:
+            squares = []
+            while empties:
+                lowest = empties & -empties
+                squares.append(lowest)
+                empties ^= lowest
+            if num_empties == 3:
+                return self._solve_3(own, opponent, squares, alpha, beta)
+            elif num_empties == 2:
+                return self._solve_2(own, opponent, squares[0], squares[1], alpha, beta)
+            elif num_empties == 1:
+                return self._solve_1(own, opponent, squares[0])
+            return bitboard.count(own) - bitboard.count(opponent)
+
+        moves = self._engine.get_moves(own, opponent)
+        if moves == 0:
+            return bitboard.count(own) - bitboard.count(opponent)
+        best_value = -self.size * self.size - 1
+        for move_bit, flips in self._order_moves(own, opponent, moves):
+            value = -self._solve(opponent ^ flips, own | flips | move_bit, -beta, -alpha)
+            if value > best_value:
+                best_value = value
+                if value > alpha:
+                    alpha = value
+                    if alpha >= beta:
+                        break
+        return best_value
+
+    def _solve_3(self, own: int, opponent: int, squares: List[int], alpha: int,
+                 beta: int) -> int:
+        """_solve for a position whose only empty squares are the three in squares.
+
+        The square that is alone in its region is tried first (parity).
+        """
+        first, second, third = squares
+        if self._regions[second.bit_length() - 1] & first == 0 \
+                and self._regions[second.bit_length() - 1] & third == 0:
+            first, second = second, first
+        elif self._regions[third.bit_length() - 1] & first == 0 \
+                and self._regions[third.bit_length() - 1] & second == 0:
+            first, third = third, first
+
+        best_value = None
+        for square, others in ((first, (second, third)), (second, (first, third)),
+                               (third, (first, second))):
+            flips = self._engine.get_flips(own, opponent, square)
+            if flips:
+                self.nodes_searched += 1
+                value = -self._solve_2(opponent ^ flips, own | flips | square,
+                                       others[0], others[1], -beta, -alpha)
+                if best_value is None or value > best_value:
+                    best_value = value
+                    if value > alpha:
+                        alpha = value
+                        if alpha >= beta:
+                            break
+        if best_value is None:
+            # the player to move has no valid moves, so the game is over
+            return bitboard.count(own) - bitboard.count(opponent)
+        return best_value
+
+    def _solve_2(self, own: int, opponent: int, first: int, second: int, alpha: int,
+                 beta: int) -> int:
+        """_solve for a position whose only empty squares are first and second."""
+        best_value = None
+        for square, other in ((first, second), (second, first)):
+            flips = self._engine.get_flips(own, opponent, square)
+            if flips:
+                self.nodes_searched += 1
+                value = -self._solve_1(opponent ^ flips, own | flips | square, other)
+                if best_value is None or value > best_value:
+                    best_value = value
+                    if value >= beta:
+                        break
+        if best_value is None:
+            return bitboard.count(own) - bitboard.count(opponent)
+        return best_value
+
+    def _solve_1(self, own: int, opponent: int, square: int) -> int:
+        """_solve for a position whose only empty square is square. The result is always
+        exact."""
+        flips = self._engine.get_flips(own, opponent, square)
+        if flips:
+            self.nodes_searched += 1
+            # the board is full after the move, so the game is over
+            return bitboard.count(own | flips | square) - bitboard.count(opponent ^ flips)
+        return bitboard.count(own) - bitboard.count(opponent)
+
+    def _order_moves(self, own: int, opponent: int, moves: int) -> List[Tuple[int, int]]:
+        """Return a (move bitboard, flips bitboard) tuple for each move in moves, ordered by
+        fastest-first (if there are enough empty squares left) and then by parity."""
+        engine = self._engine
+        empties = engine.full & ~(own | opponent)
+        fastest_first = bitboard.count(empties) > _FASTEST_FIRST_EMPTIES
+        keyed_moves = []
+        while moves:
+            move_bit = moves & -moves
+            moves ^= move_bit
+            flips = engine.get_flips(own, opponent, move_bit)
+            # 0 if the region of the move has an odd number of empty squares, 1 otherwise
+            parity = 1 - bitboard.count(empties & self._regions[move_bit.bit_length() - 1]) % 2
+            if fastest_first:
+                mobility = bitboard.count(engine.get_moves(opponent ^ flips,
+                                                           own | flips | move_bit))
+            else:
+                mobility = 0
+            keyed_moves.append((mobility, parity, move_bit.bit_length(), move_bit, flips))
+        keyed_moves.sort()
+        return [(move_bit, flips) for _, _, _, move_bit, flips in keyed_moves]
+
+
+def count_empties(game: ReversiGame) -> int:
+    """Return the number of empty squares on the board of game.
+
+    >>> count_empties(ReversiGame())
+    60
+    """
+    black, white = game.get_bitboards()
+    size = game.get_board().size
+    return size * size - bitboard.count(black | white)
+
+
+def test_solver(board_size: int, empties: int, num_positions: int) -> None:
+    """
+    test_solver plays random games on a board_size by board_size board until there are empties
+    empty squares left, solves each of num_positions such positions, and prints the number of
+    positions solved per second and the number of positions searched per second.
+    """
+    solver = EndgameSolver(board_size)
+    total_nodes = 0
+    while solver.positions_solved < num_positions:
+        game = ReversiGame()
+        game.set_board_size(board_size)
+        game.start_game()
+        while game.get_winner() is None and count_empties(game) > empties:
+            game.make_move(random.choice(list(game.get_valid_moves())))
+        if game.get_winner() is None:
+            solver.solve(game)
+            total_nodes += solver.nodes_searched
+    print("Positions solved per second: " + str(solver.get_positions_per_second()))
+    print("Positions searched per second: " + str(total_nodes / solver.solve_time))
+
+
+if __name__ == '__main__':
+    import python_ta.contracts
+
+    python_ta.contracts.check_all_contracts()
+
+    import doctest
+
+    doctest.testmod()
+
+    import python_ta
+
+    python_ta.check_all(config={
+        'extra-imports': ['random', 'time', 'typing', 'bitboard',
+                          'reversi'],  # the names (strs) of imported modules
+        'allowed-io': ['test_solver'],  # the names (strs) of functions that call print/open/input
+        'max-line-length': 100,
+        'disable': ['E1136']
+    })
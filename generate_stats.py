@@ -22,33 +22,32 @@ DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE,
 OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
 """
 
+from typing import Optional
+
 import ai_players
 import reversi
 import stats
+import tournament
 
 
 def generate_stats(player1: ai_players.Player, player2: ai_players.Player, board_size: int,
-                   iterations: int) -> None:
+                   iterations: int, workers: Optional[int] = None, seed: int = 0) -> None:
     """Generates the statistics for iterations number of games between player1 and player2. player1
     represents the black player and player2 represents the white player.
 
+    The games are played in parallel by workers processes (one per CPU if workers is None), and
+    game i is played with the random seed seed + i, so the results are reproducible.
+
     Preconditions:
         - board_size >= 2
         - board_size % 2 == 0
+        - workers is None or workers > 0
+        - player1 and player2 can be pickled (so they are not ParallelMinimaxABPlayers)
     """
-    results = []
     game = reversi.ReversiGame()
     game.set_board_size(board_size)
-    for _ in range(iterations):
-        game = reversi.ReversiGame()
-        prev_move = (-1, -1)
-        while game.get_winner() is None:
-            move = player1.make_move(game, prev_move)
-            game.try_make_move(move)
-            if game.get_winner() is None:
-                prev_move = player2.make_move(game, move)
-                game.try_make_move(prev_move)
-        results.append(game.get_winner())
+    game.start_game()
+    results = tournament.run_tournament(player1, player2, board_size, iterations, workers, seed)
     stats.plot_game_statistics(game, results, 'black', player1, player2)
 
 
@@ -64,12 +63,16 @@ if __name__ == '__main__':
     import python_ta
 
     python_ta.check_all(config={
-        'extra-imports': ['ai_players',
+        'extra-imports': ['typing',
+                          'ai_players',
                           'reversi',
-                          'stats'],  # the names (strs) of imported modules
+                          'stats',
+                          'tournament'],  # the names (strs) of imported modules
         'allowed-io': [],  # the names (strs) of functions that call print/open/input
         'max-line-length': 100,
         'disable': ['E1136']
     })
 
     # generate_stats(ai_players.MinimaxABPlayer(2, 16), ai_players.RandomPlayer(), 16, 200)
+    # generate_stats(ai_players.make_player('PVS 4', 8), ai_players.make_player('Minimax 4', 8),
+    #                8, 200)
@@ -22,14 +22,83 @@ DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE,
 OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
 """
 
-import pygame
-from ui_handler import UIHandler, increment_player_score
-from window import Window
+import argparse
+import time
+from typing import List, Optional
+
 from reversi import ReversiGame
-from board_manager import BoardManager
-from ai_players import MinimaxABPlayer
+from ai_players import MinimaxABPlayer, make_player
 
-if __name__ == "__main__":
+
+def run_headless(black: str, white: str, board_size: int, num_games: int,
+                 render_every: int = 0, render_final: bool = False) -> List[str]:
+    """Play num_games games between the players named black and white (see
+    ai_players.make_player) on a board_size by board_size board without opening a window, and
+    return the list of winners.
+
+    Every position of every render_every-th game is printed (none if render_every is 0), and
+    the final position of every game is printed if render_final is True.
+
+    Preconditions:
+        - board_size >= 2
+        - board_size % 2 == 0
+        - num_games >= 0
+        - render_every >= 0
+
+    Raise ValueError before playing any games if black or white is not a player name.
+
+    >>> results = run_headless('Random Moves', 'Random Moves', 4, 3)
+    >>> len(results)
+    3
+    >>> run_headless('Minimax4', 'Random Moves', 4, 3)
+    Traceback (most recent call last):
+    ...
+    ValueError: Unknown player "Minimax4"
+    """
+    # There is no human player in headless mode
+    game = ReversiGame(human_player=0)
+    game.set_board_size(board_size)
+    game.start_game(human_player=0)
+
+    colour_to_player = {1: make_player(black, board_size), -1: make_player(white, board_size)}
+
+    # List of moves made
+    moves_made = [(-1, -1)]
+
+    # List of game win results
+    results = []
+
+    render = render_every > 0 and 1 % render_every == 0
+    while len(results) < num_games:
+        if render:
+            print(f'Game {len(results) + 1}, move {len(moves_made) - 1}:\n{game.get_board()}\n')
+
+        # Get game winner
+        winner = game.get_winner()
+        if winner is not None:
+            if render_final and not render:
+                print(f'Game {len(results) + 1}, final position:\n{game.get_board()}\n')
+            results.append(winner)
+            game.start_game(human_player=0)
+            moves_made = [(-1, -1)]
+            render = render_every > 0 and (len(results) + 1) % render_every == 0
+        else:
+            next_move = colour_to_player[game.get_current_player()].make_move(game,
+                                                                              moves_made[-1])
+            game.try_make_move(next_move)
+            moves_made.append(next_move)
+
+    return results
+
+
+def run_window() -> None:
+    """Open the Reversi window and run it until it is closed."""
+    # These are imported here, so that the headless mode does not need pygame
+    import pygame
+    from ui_handler import UIHandler, increment_player_score
+    from window import Window
+    from board_manager import BoardManager
+    from search_worker import SearchWorker
 
     # Initialize PyGame
     pygame.init()
@@ -46,6 +115,9 @@ if __name__ == "__main__":
 
     ui_handler = UIHandler()
 
+    # Runs the AI searches, so that the window keeps updating while an AI is thinking
+    search_worker = SearchWorker()
+
     # Minimax Player
 
     player1 = MinimaxABPlayer(2, 8)
@@ -62,7 +134,7 @@ if __name__ == "__main__":
     results = []
 
     # Add UI to the window
-    ui_handler.add_ui(window, game, results, colour_to_player)
+    ui_handler.add_ui(window, game, results, colour_to_player, search_worker)
 
     # Window loop
     while window.is_running():
@@ -88,10 +160,21 @@ if __name__ == "__main__":
                         if square != (-1, -1):
                             if game.try_make_move(square):
                                 moves_made.append(square)
+                search_worker.cancel()
             elif game.get_winner() is None:
-                next_move = colour_to_player[game.get_current_player()].make_move(game, moves_made[-1])
-                game.try_make_move(next_move)
-                moves_made.append(next_move)
+                next_move = search_worker.request_move(colour_to_player[game.get_current_player()],
+                                                       game, moves_made[-1])
+                if next_move is not None:
+                    game.try_make_move(next_move)
+                    moves_made.append(next_move)
+        else:
+            search_worker.cancel()
+
+        # Show the indicator while an AI move is pending
+        ui_handler.update_thinking_text(not ui_handler.get_game_paused()
+                                        and game.get_winner() is None
+                                        and game.get_human_player() != game.get_current_player(),
+                                        window)
 
         # Update the window's clock
         window.update_clock()
@@ -112,3 +195,48 @@ if __name__ == "__main__":
 
     # Once loop ends, quit pygame.
     pygame.quit()
+
+
+def parse_arguments(args: Optional[List[str]] = None) -> argparse.Namespace:
+    """Return the command line arguments in args (or sys.argv if args is None).
+
+    >>> arguments = parse_arguments(['--headless', '--games', '10'])
+    >>> arguments.headless, arguments.games, arguments.black
+    (True, 10, 'Minimax 2')
+    """
+    parser = argparse.ArgumentParser(description='Play Reversi against AI players, or watch '
+                                                 'them play each other.')
+    parser.add_argument('--headless', action='store_true',
+                        help='play AI vs. AI games without opening a window, as fast as the '
+                             'players can move')
+    parser.add_argument('--games', type=int, default=40,
+                        help='the number of games to play in headless mode (default: 40)')
+    parser.add_argument('--board-size', type=int, default=8,
+                        help='the board size in headless mode (default: 8)')
+    parser.add_argument('--black', default='Minimax 2',
+                        help="the black AI in headless mode, e.g. 'Random Moves', 'Minimax 4', "
+                             "'PVS 6' or 'Timed 1s' (default: 'Minimax 2')")
+    parser.add_argument('--white', default='Minimax 2',
+                        help="the white AI in headless mode (default: 'Minimax 2')")
+    parser.add_argument('--render-every', type=int, default=0, metavar='N',
+                        help='print every position of every Nth game in headless mode')
+    parser.add_argument('--render-final', action='store_true',
+                        help='print the final position of every game in headless mode')
+    return parser.parse_args(args)
+
+
+if __name__ == "__main__":
+    arguments = parse_arguments()
+
+    if arguments.headless:
+        start_time = time.perf_counter()
+        game_results = run_headless(arguments.black, arguments.white, arguments.board_size,
+                                    arguments.games, arguments.render_every,
+                                    arguments.render_final)
+        elapsed = time.perf_counter() - start_time
+        print(f'Black ({arguments.black}): {game_results.count("black")} wins, '
+              f'White ({arguments.white}): {game_results.count("white")} wins, '
+              f'Draws: {game_results.count("draw")}')
+        print(f'{len(game_results)} games in {elapsed:.2f} seconds')
+    else:
+        run_window()
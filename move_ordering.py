@@ -0,0 +1,159 @@
+"""
+move_ordering.py:
+Contains the MoveOrderer class, which decides the order in which the AIs search moves.
+CSC111 Final Project by Anatoly Zavyalov, Baker Jackson, Elliot Schrider, Rachel Kim
+
+Copyright 2021 Anatoly Zavyalov, Baker Jackson, Elliot Schrider, Rachel Kim
+
+Permission is hereby granted, free of charge, to any person obtaining a copy of this software and
+associated documentation files (the "Software"), to deal in the Software without restriction,
+including without limitation the rights to use, copy, modify, merge, publish, distribute,
+sublicense, and/or sell copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all copies or substantial
+portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR IMPLIED, INCLUDING BUT
+NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND
+NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM,
+DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+"""
+
+import random
+from typing import List, Optional, Tuple
+
+# The number of killer moves remembered for each ply
+_NUM_KILLERS = 2
+
+
+def scale_heuristic(heuristic_list: List[List[int]], size: int) -> List[List[int]]:
+    """Return a <size> by <size> version of the square heuristic_list, where the squares near
+    the edges of the board copy the squares near the edges of heuristic_list, and the squares
+    in the middle copy the middle of heuristic_list.
+
+    >>> table = [[9, 1, 9], [1, 0, 1], [9, 1, 9]]
+    >>> scale_heuristic(table, 4)
+    [[9, 1, 1, 9], [1, 0, 0, 1], [1, 0, 0, 1], [9, 1, 1, 9]]
+
+    Preconditions:
+     - len(heuristic_list) >= 3
+     - all(len(row) == len(heuristic_list) for row in heuristic_list)
+    """
+    length = len(heuristic_list)
+    # map each row (or column) to the row of heuristic_list that is the same distance from the
+    # nearest edge, or to the middle row if it is further from the edges than any of those
+    max_distance = (length - 1) // 2
+    mapping = []
+    for i in range(size):
+        if i < size / 2:
+            mapping.append(min(i, max_distance))
+        else:
+            mapping.append(length - 1 - min(size - 1 - i, max_distance))
+    return [[heuristic_list[mapping[row]][mapping[column]] for column in range(size)]
+            for row in range(size)]
+
+
+class MoveOrderer:
+    """
+    MoveOrderer sorts the moves of a position so that alpha-beta searches the moves that are
+    most likely to be best first, which lets it prune far more of the tree.
+
+    Moves are searched in this order:
+     1. the hash move (the best move stored in the transposition table)
+     2. the killer moves of the ply (moves that caused a cutoff in a sibling position)
+     3. the remaining moves, by their history score (how often and how deep they caused cutoffs
+        so far) and then by their static priority (how good the square is in general)
+    Moves that are still tied are ordered randomly, so the AI does not always play the same game.
+
+    Instance Attributes:
+     - static_priority: static_priority[row][column] is the static priority of the square
+
+    >>> orderer = MoveOrderer([[5, 1, 5], [1, 0, 1], [5, 1, 5]], 4)
+    >>> orderer.order_moves([(0, 1), (1, 1), (0, 0)], ply=0, hash_move=None)
+    [(0, 0), (0, 1), (1, 1)]
+    >>> orderer.record_cutoff((1, 1), ply=0, depth=2)
+    >>> orderer.order_moves([(0, 1), (1, 1), (0, 0)], ply=0, hash_move=(0, 1))
+    [(0, 1), (1, 1), (0, 0)]
+    """
+    static_priority: List[List[int]]
+
+    # Private Instance Attributes:
+    # - _killers: _killers[ply] is a list of the most recent moves that caused a cutoff at ply,
+    #             the most recent first
+    # - _history: _history[row][column] is the history score of the square
+
+    _killers: List[List[Tuple[int, int]]]
+    _history: List[List[int]]
+
+    def __init__(self, heuristic_list: List[List[int]], size: int) -> None:
+        """Initialize the orderer for a <size> by <size> board, with static priorities taken from
+        the square table heuristic_list (scaled to the board size)."""
+        self.static_priority = scale_heuristic(heuristic_list, size)
+        self._killers = []
+        self._history = [[0] * size for _ in range(size)]
+
+    def order_moves(self, moves: List[Tuple[int, int]], ply: int,
+                    hash_move: Optional[Tuple[int, int]]) -> List[Tuple[int, int]]:
+        """Return the moves in the order they should be searched.
+
+        ply is the number of moves between the root of the search and the position.
+        """
+        killers = self._killers[ply] if ply < len(self._killers) else []
+        history = self._history
+        static_priority = self.static_priority
+
+        def key(move: Tuple[int, int]) -> Tuple[int, int, int, float]:
+            if move == hash_move:
+                group = 2 + _NUM_KILLERS
+            elif move in killers:
+                group = 1 + _NUM_KILLERS - killers.index(move)
+            else:
+                group = 0
+            return (group, history[move[0]][move[1]], static_priority[move[0]][move[1]],
+                    random.random())
+
+        return sorted(moves, key=key, reverse=True)
+
+    def record_cutoff(self, move: Tuple[int, int], ply: int, depth: int) -> None:
+        """Record that move caused a beta cutoff at ply, with depth moves left to search."""
+        while len(self._killers) <= ply:
+            self._killers.append([])
+        killers = self._killers[ply]
+        if move in killers:
+            killers.remove(move)
+        killers.insert(0, move)
+        del killers[_NUM_KILLERS:]
+
+        self._history[move[0]][move[1]] += depth * depth
+
+    def new_search(self) -> None:
+        """Prepare for a search from a new root position. The killer moves are forgotten, since
+        the plies now refer to different positions, and the history scores are halved so that
+        recent cutoffs count the most."""
+        self._killers = []
+        for row in self._history:
+            for column in range(len(row)):
+                row[column] //= 2
+
+
+if __name__ == "__main__":
+    # Test doctests
+    import doctest
+    doctest.testmod()
+
+    import python_ta.contracts
+
+    python_ta.contracts.check_all_contracts()
+
+    import python_ta
+    python_ta.check_all(config={
+        # the names (strs) of imported modules
+        'extra-imports': ['random'],
+        'allowed-io': [],  # the names (strs) of functions that call print/open/input
+        'max-line-length': 100,
+
+        # Disable too-many-nested-blocks, too-many-arguments
+        'disable': ['E1136', 'R1702', 'R0913']
+    })
@@ -0,0 +1,177 @@
+"""
+opening_book.py:
+Contains the OpeningBook class, used by the AI players to play the first moves of the game
+without searching.
+CSC111 Final Project by Anatoly Zavyalov, Baker Jackson, Elliot Schrider, Rachel Kim
+
+Copyright 2021 Anatoly Zavyalov, Baker Jackson, Elliot Schrider, Rachel Kim
+
+Permission is hereby granted, free of charge, to any person obtaining a copy of this software and
+associated documentation files (the "Software"), to deal in the Software without restriction,
+including without limitation the rights to use, copy, modify, merge, publish, distribute,
+sublicense, and/or sell copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all copies or substantial
+portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR IMPLIED, INCLUDING BUT
+NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND
+NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM,
+DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+"""
+
+import mmap
+import os
+import struct
+from typing import Dict, Optional, Tuple
+
+import bitboard
+from reversi import ReversiGame
+
+# The directory the opening books are stored in, relative to the working directory.
+BOOK_DIRECTORY = 'books'
+
+# A book file starts with a header holding these bytes and the size of the board...
+_MAGIC = b'RVBK'
+_HEADER = struct.Struct('<4sH')
+# ...followed by one record per position, sorted by key: the canonical hash of the position (see
+# ReversiGame.get_canonical_hash), the bit index of the best move in the canonical position, and
+# its score.
+_RECORD = struct.Struct('<QHi')
+
+
+class OpeningBook:
+    """The best moves of the early positions of the game, read from a book file.
+
+    The file is memory-mapped instead of read, so opening a book costs nothing no matter how
+    big it is, and only the records that are looked at are ever loaded from the disk. A position
+    is found by binary search on the sorted keys.
+
+    Positions are stored once for all their symmetries: the key of a position is the hash of
+    its canonical version (see ReversiGame.get_canonical_hash), and the move is stored for the
+    canonical version and moved back to the position when it is looked up.
+
+    Instance Attributes:
+     - path: the path of the book file
+     - size: the size of the board (in squares) the book is for
+     - num_records: the number of positions in the book
+    """
+    path: str
+    size: int
+    num_records: int
+
+    # Private Instance Attributes:
+    # - _map: the memory-mapped book file
+
+    _map: mmap.mmap
+
+    def __init__(self, path: str) -> None:
+        """Open the book file at path.
+
+        Preconditions:
+            - path is a book file written by write_book
+        """
+        self.path = path
+        with open(path, 'rb') as book_file:
+            self._map = mmap.mmap(book_file.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, self.size = _HEADER.unpack_from(self._map, 0)
+        if magic != _MAGIC:
+            raise ValueError(f'"{path}" is not an opening book')
+        self.num_records = (len(self._map) - _HEADER.size) // _RECORD.size
+
+    def __getstate__(self) -> str:
+        """Pickle the book as its path, as the memory map cannot be pickled."""
+        return self.path
+
+    def __setstate__(self, path: str) -> None:
+        """Open the pickled book again."""
+        self.__init__(path)
+
+    def lookup(self, game: ReversiGame) -> Optional[Tuple[int, int]]:
+        """Return the book move in the position of game, or None if it is not in the book.
+
+        Preconditions:
+            - game.get_board().size == self.size
+        """
+        key, transform = game.get_canonical_hash()
+        low = 0
+        high = self.num_records
+        while low < high:
+            middle = (low + high) // 2
+            record_key, index, _ = _RECORD.unpack_from(self._map,
+                                                       _HEADER.size + middle * _RECORD.size)
+            if record_key < key:
+                low = middle + 1
+            elif record_key > key:
+                high = middle
+            else:
+                move = game.transform_move(divmod(index, self.size),
+                                           bitboard.INVERSE_TRANSFORMS[transform])
+                # guard against a different position with the same key
+                if move in game.get_valid_moves():
+                    return move
+                return None
+        return None
+
+    def close(self) -> None:
+        """Close the book file."""
+        self._map.close()
+
+
+def write_book(path: str, size: int, records: Dict[int, Tuple[int, int]]) -> None:
+    """Write a book file for a <size> by <size> board to path, where records maps the canonical
+    hash of each position to the bit index of its best move in the canonical position and the
+    move's score.
+    """
+    directory = os.path.dirname(path)
+    if directory != '':
+        os.makedirs(directory, exist_ok=True)
+    with open(path, 'wb') as book_file:
+        book_file.write(_HEADER.pack(_MAGIC, size))
+        for key in sorted(records):
+            index, score = records[key]
+            book_file.write(_RECORD.pack(key, index, score))
+
+
+def get_book_path(size: int) -> str:
+    """Return the path of the opening book for a <size> by <size> board.
+
+    >>> get_book_path(8) == os.path.join('books', 'book_8.bin')
+    True
+    """
+    return os.path.join(BOOK_DIRECTORY, f'book_{size}.bin')
+
+
+# The opening books that have been loaded so far (or None if there is no book), keyed by size.
+_BOOKS: Dict[int, Optional[OpeningBook]] = {}
+
+
+def load_book(size: int) -> Optional[OpeningBook]:
+    """Return the opening book for a <size> by <size> board, or None if there is none. Each
+    book is only opened once."""
+    if size not in _BOOKS:
+        path = get_book_path(size)
+        _BOOKS[size] = OpeningBook(path) if os.path.exists(path) else None
+    return _BOOKS[size]
+
+
+if __name__ == '__main__':
+    import python_ta.contracts
+
+    python_ta.contracts.check_all_contracts()
+
+    import doctest
+
+    doctest.testmod()
+
+    import python_ta
+
+    python_ta.check_all(config={
+        'extra-imports': ['mmap', 'os', 'struct', 'typing', 'bitboard',
+                          'reversi'],  # the names (strs) of imported modules
+        'allowed-io': ['OpeningBook.__init__', 'write_book'],
+        'max-line-length': 100,
+        'disable': ['E1136']
+    })
@@ -23,9 +23,9 @@ OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SO
 """
 
 from __future__ import annotations
-import copy
-from typing import Optional, Set, Tuple
+from typing import List, Optional, Set, Tuple
 from board import Board
+import bitboard
 
 _BLACK = 1
 _WHITE = -1
@@ -48,12 +48,48 @@ class ReversiGame:
     - _move_count: the number of moves that have been made in the current game
     - _human_player: int representing which player the human is (1 for black, -1 for white
                      and 0 if there is no human player in the game)
+    - _engine: the BitboardEngine for the size of self._board
+    - _black: bitboard of the black pieces
+    - _white: bitboard of the white pieces
+    - _moves: bitboard of the valid moves for the current player
+    - _valid_moves_stale: whether self._board.valid_moves is out of date with self._moves. The
+                          set of valid moves is only rebuilt when it is asked for, so searches
+                          that only need the bitboards never build it.
+    - _hashes: the Zobrist hashes of all the symmetries of the current position (pieces and
+               player to move), packed into one int (see BitboardEngine)
+    - _winner: the winner of the current position, as returned by get_winner. It is updated
+               whenever the position changes, so get_winner never has to look at the board.
+    - _num_black: the number of black pieces on the board
+    - _num_white: the number of white pieces on the board
+    - _heuristic_list: the heuristic table set with set_heuristic, or None if there is none
+    - _weights: _weights[i] is the weight of bit i in self._heuristic_list (empty if there is
+                no heuristic table)
+    - _score: the sum of the weights of the white pieces minus the sum of the weights of the
+              black pieces in self._heuristic_list (0 if there is no heuristic table)
+    - _undo_stack: a record for each move made with push_move that has not been undone yet,
+                   stored as a tuple (move, flips, previous player, previous self._moves,
+                   previous self._board.valid_moves or None if it was out of date,
+                   previous self._hashes, previous self._score)
     """
 
     _board: Board
     _current_player: int
     _move_count: int
     _human_player: int
+    _engine: bitboard.BitboardEngine
+    _black: int
+    _white: int
+    _moves: int
+    _valid_moves_stale: bool
+    _hashes: int
+    _winner: Optional[str]
+    _num_black: int
+    _num_white: int
+    _heuristic_list: Optional[List[List[int]]]
+    _weights: List[int]
+    _score: int
+    _undo_stack: List[Tuple[Tuple[int, int], int, int, int, Optional[Set[Tuple[int, int]]], int,
+                            int]]
 
     def __init__(self, board: list[list[int]] = None,
                  current_player: int = _BLACK, move_count: int = 0, human_player: int = 0) -> None:
@@ -67,6 +103,8 @@ class ReversiGame:
         """
 
         self._board = Board()
+        self._heuristic_list = None
+        self._weights = []
 
         self.start_game(board, current_player, move_count, human_player)
 
@@ -82,7 +120,8 @@ class ReversiGame:
         """
 
         if board is not None:
-            self._board.set_board(board)
+            # the rows are copied, since moves change the pieces in place
+            self._board.set_board([row[:] for row in board])
         else:
             self._board.create_board()
             self._board.set_piece(row=self._board.size // 2 - 1, column=self._board.size // 2 - 1,
@@ -97,11 +136,27 @@ class ReversiGame:
         self._current_player = current_player
         self._move_count = move_count
         self._human_player = human_player
+        self._undo_stack = []
+
+        self._engine = bitboard.get_engine(self._board.size)
+        self._black, self._white = self._engine.pieces_to_bitboards(self._board.pieces)
+        self._hashes = self._engine.get_symmetric_hashes(self._black, self._white,
+                                                         self._current_player)
+        self._num_black = bitboard.count(self._black)
+        self._num_white = bitboard.count(self._white)
+
+        heuristic_list = self._heuristic_list
+        self._heuristic_list = None
+        self._weights = []
+        self._score = 0
+        if heuristic_list is not None and len(heuristic_list) == self._board.size:
+            self.set_heuristic(heuristic_list)
 
         self._recalculate_valid_moves()
 
     def get_board(self) -> Board:
         """Return the Board instance."""
+        self._update_valid_moves_set()
         return self._board
 
     def set_board_size(self, size: int) -> None:
@@ -112,18 +167,54 @@ class ReversiGame:
          """
         self._board.set_size(size)
 
+    def set_heuristic(self, heuristic_list: List[List[int]]) -> None:
+        """Keep a running positional score of the position with the weights in heuristic_list,
+        updated with every move, so that it can be read with get_positional_score.
+
+        The score is recalculated from the whole board only if heuristic_list is not the
+        table that is already being used.
+
+        Preconditions:
+         - heuristic_list is a self.get_board().size by self.get_board().size 2-d list
+
+        >>> game = ReversiGame()
+        >>> table = [[row * 8 + column for column in range(8)] for row in range(8)]
+        >>> game.set_heuristic(table)
+        >>> game.get_positional_score()
+        0
+        >>> game.make_move((2, 4))
+        >>> game.get_positional_score() == -(20 + 27 + 28 + 35 + 36) + 2 * 35
+        True
+        """
+        if heuristic_list is self._heuristic_list:
+            return
+        self._heuristic_list = heuristic_list
+        self._weights = [weight for row in heuristic_list for weight in row]
+        self._score = self._sum_weights(self._white) - self._sum_weights(self._black)
+
+    def get_heuristic_list(self) -> Optional[List[List[int]]]:
+        """Return the heuristic table set with set_heuristic, or None if there is none."""
+        return self._heuristic_list
+
+    def get_positional_score(self) -> int:
+        """Return the sum of the weights of the white pieces minus the sum of the weights of
+        the black pieces in the heuristic table set with set_heuristic (0 if there is none).
+        """
+        return self._score
+
     def get_human_player(self) -> int:
         """Return the integer representing the human player"""
         return self._human_player
 
     def get_valid_moves(self) -> Set[Tuple[int, int]]:
         """Return a list of the valid moves for the active player."""
+        self._update_valid_moves_set()
         return self._board.valid_moves
 
     def try_make_move(self, move: Tuple[int, int]) -> bool:
         """Try to make a Reversi move by calling make_move if the move is valid."""
-        if self._board.is_valid_move(row=move[0], column=move[1]):
-            self.make_move(move)
+        if self._is_valid_move(move):
+            self._apply_move(move)
             return True
         return False
 
@@ -133,145 +224,322 @@ class ReversiGame:
 
         If move is not a currently valid move, raise a ValueError.
         """
-        if not self._board.is_valid_move(row=move[0], column=move[1]):
+        if not self._is_valid_move(move):
             raise ValueError(f'Move "{move}" is not valid')
 
-        self._board.set_board(self._board_after_move(move))
-        self._current_player = -self._current_player
-        self._move_count += 1
-        self._recalculate_valid_moves()
+        self._apply_move(move)
+
+    def copy(self) -> ReversiGame:
+        """Return a copy of this ReversiGame. Moves made in the copy do not change this game.
+
+        The copy does not share the undo stack, so pop_move cannot undo moves made with
+        push_move before the copy was made.
+        """
+        new_game = ReversiGame.__new__(ReversiGame)
+        new_game._board = self._board.copy()
+        new_game._current_player = self._current_player
+        new_game._move_count = self._move_count
+        new_game._human_player = self._human_player
+        new_game._engine = self._engine
+        new_game._black = self._black
+        new_game._white = self._white
+        new_game._moves = self._moves
+        new_game._valid_moves_stale = self._valid_moves_stale
+        new_game._hashes = self._hashes
+        new_game._winner = self._winner
+        new_game._num_black = self._num_black
+        new_game._num_white = self._num_white
+        new_game._heuristic_list = self._heuristic_list
+        new_game._weights = self._weights
+        new_game._score = self._score
+        new_game._undo_stack = []
+        return new_game
 
     def copy_and_make_move(self, move: Tuple[int, int]) -> ReversiGame:
         """Make the given chess move in a copy of this ReversiGame, and return that copy.
 
         If move is not a currently valid move, raise a ValueError.
         """
-        return ReversiGame(board=self._board_after_move(move),
-                           current_player=-self._current_player,
-                           move_count=self._move_count + 1)
+        if not self._is_valid_move(move):
+            raise ValueError(f'Move "{move}" is not valid')
+
+        new_game = self.copy()
+        new_game._apply_move(move)
+        return new_game
+
+    def push_move(self, move: Tuple[int, int]) -> None:
+        """Make the given Reversi move in place, remembering what it changed so that it can be
+        undone with pop_move. This lets a search walk the game tree on a single ReversiGame
+        instead of copying the game for every position.
+
+        If move is not a currently valid move, raise a ValueError.
+
+        >>> game = ReversiGame()
+        >>> game.push_move((2, 4))
+        >>> game.get_board().pieces[3][4]
+        1
+        >>> game.pop_move()
+        (2, 4)
+        >>> game.get_board().pieces[3][4]
+        -1
+        >>> game.get_current_player()
+        1
+        """
+        if not self._is_valid_move(move):
+            raise ValueError(f'Move "{move}" is not valid')
+
+        if self._valid_moves_stale:
+            previous_valid_moves = None
+        else:
+            previous_valid_moves = self._board.valid_moves
+        previous_moves = self._moves
+        previous_player = self._current_player
+        previous_hashes = self._hashes
+        previous_score = self._score
+
+        flips = self._apply_move(move)
+        self._undo_stack.append((move, flips, previous_player, previous_moves,
+                                 previous_valid_moves, previous_hashes, previous_score))
+
+    def pop_move(self) -> Tuple[int, int]:
+        """Undo the most recent move made with push_move and return it.
+
+        Preconditions:
+        - a move made with push_move has not been undone yet
+        - make_move has not been called since that move was made
+        """
+        move, flips, previous_player, previous_moves, previous_valid_moves, previous_hashes, \
+            previous_score = self._undo_stack.pop()
+        move_bit = self._engine.square_to_bit(move[0], move[1])
+
+        pieces = self._board.pieces
+        pieces[move[0]][move[1]] = 0
+        flipped_squares = self._engine.bits_to_squares(flips)
+        for row, column in flipped_squares:
+            pieces[row][column] = -previous_player
+
+        if previous_player == _BLACK:
+            self._black ^= flips | move_bit
+            self._white |= flips
+            self._num_black -= len(flipped_squares) + 1
+            self._num_white += len(flipped_squares)
+        else:
+            self._white ^= flips | move_bit
+            self._black |= flips
+            self._num_white -= len(flipped_squares) + 1
+            self._num_black += len(flipped_squares)
+
+        self._current_player = previous_player
+        self._move_count -= 1
+        self._moves = previous_moves
+        self._update_winner()
+        self._hashes = previous_hashes
+        self._score = previous_score
+        if previous_valid_moves is None:
+            self._valid_moves_stale = True
+        else:
+            self._board.valid_moves = previous_valid_moves
+            self._valid_moves_stale = False
+
+        return move
 
     def get_current_player(self) -> int:
         """Return whether the black player is to move next."""
         return self._current_player
 
+    def get_hash(self) -> int:
+        """Return the Zobrist hash of the current position. Positions with the same pieces and
+        the same player to move have the same hash, no matter which moves led to them.
+
+        >>> game = ReversiGame()
+        >>> for move in [(2, 4), (2, 5), (3, 5), (2, 3)]:
+        ...     game.make_move(move)
+        >>> other_game = ReversiGame()
+        >>> for move in [(3, 5), (2, 5), (2, 4), (2, 3)]:
+        ...     other_game.make_move(move)
+        >>> game.get_hash() == other_game.get_hash()
+        True
+        >>> game.get_hash() == ReversiGame(board=game.get_board().pieces).get_hash()
+        True
+        """
+        return self._hashes & bitboard.HASH_MASK
+
+    def get_canonical_hash(self) -> Tuple[int, int]:
+        """Return the hash of the canonical version of the current position, and the transform
+        (see BitboardEngine.transform_square) that moves the current position to it.
+
+        The canonical version of a position is the symmetry of it (rotation or reflection)
+        with the smallest hash, so all the symmetries of a position have the same canonical
+        hash, and caches keyed by it can share their entries between them.
+
+        >>> game = ReversiGame()
+        >>> game.make_move((2, 4))
+        >>> other_game = ReversiGame()
+        >>> other_game.make_move((5, 3))
+        >>> game.get_hash() == other_game.get_hash()
+        False
+        >>> game.get_canonical_hash()[0] == other_game.get_canonical_hash()[0]
+        True
+        """
+        return min((bitboard.get_transformed_hash(self._hashes, transform), transform)
+                   for transform in range(bitboard.NUM_TRANSFORMS))
+
+    def transform_move(self, move: Tuple[int, int], transform: int) -> Tuple[int, int]:
+        """Return the square that move is moved to by transform (see
+        BitboardEngine.transform_square)."""
+        return self._engine.transform_square(move[0], move[1], transform)
+
+    def get_bitboards(self) -> Tuple[int, int]:
+        """Return the (black, white) bitboards of the pieces on the board. Bit
+        (row * size + column) of a bitboard is set if the player has a piece on [row][column].
+
+        >>> game = ReversiGame()
+        >>> black, white = game.get_bitboards()
+        >>> black == (1 << (3 * 8 + 3)) | (1 << (4 * 8 + 4))
+        True
+        """
+        return self._black, self._white
+
+    def get_move_result(self, move: Tuple[int, int]) -> Tuple[int, int, bool, int]:
+        """Return the (black, white) bitboards of the position after the current player plays
+        move, whether the game is over in that position, and its positional score (see
+        get_positional_score), without making the move.
+
+        This is much cheaper than making and undoing the move, as it does not update the board,
+        the hash or the valid moves.
+
+        Preconditions:
+        - move is a currently valid move
+
+        >>> game = ReversiGame()
+        >>> game.set_heuristic([[1] * 8 for _ in range(8)])
+        >>> black, white, game_over, score = game.get_move_result((2, 4))
+        >>> game.push_move((2, 4))
+        >>> (black, white) == game.get_bitboards() and not game_over
+        True
+        >>> score == game.get_positional_score()
+        True
+        """
+        engine = self._engine
+        index = move[0] * engine.size + move[1]
+        move_bit = 1 << index
+        score = self._score
+        if self._current_player == _BLACK:
+            flips = engine.get_flips(self._black, self._white, move_bit)
+            black = self._black | flips | move_bit
+            white = self._white ^ flips
+            game_over = engine.get_moves(white, black) == 0
+            if self._heuristic_list is not None:
+                score -= self._weights[index] + 2 * self._sum_weights(flips)
+        else:
+            flips = engine.get_flips(self._white, self._black, move_bit)
+            white = self._white | flips | move_bit
+            black = self._black ^ flips
+            game_over = engine.get_moves(black, white) == 0
+            if self._heuristic_list is not None:
+                score += self._weights[index] + 2 * self._sum_weights(flips)
+        return black, white, game_over, score
+
     def get_winner(self) -> Optional[str]:
         """Return the winner of the game (black or white) or 'draw' if the game ended in a draw.
 
         Return None if the game is not over.
         """
-        if len(self._board.valid_moves) == 0:
-            num_black = sum([row.count(_BLACK) for row in self._board.pieces])
-            num_white = sum([row.count(_WHITE) for row in self._board.pieces])
-            if num_black > num_white:
-                return 'black'
-            elif num_black < num_white:
-                return 'white'
-            else:
-                return 'draw'
-
-        return None
-
-    def _calculate_moves_and_paths_for_board(self, current_player: int) \
-            -> Tuple[Set[Tuple[int, int]], Set[Tuple[Tuple[int, int], Tuple[int, int]]]]:
-        """Return all possible moves and paths on a given board with a given active player.
-           A path is a tuple of two integers representing the start square and end square
-           of the path of the pieces which will be changed to the current player's colour when
-           the move is made.
+        return self._winner
 
-        Preconditions:
-        - current_player in [_BLACK, _WHITE]
-        """
-        moves_and_paths = (set(), set())
+    def _is_valid_move(self, move: Tuple[int, int]) -> bool:
+        """Return whether move is a valid move for the current player."""
+        return 0 <= move[0] < self._board.size and 0 <= move[1] < self._board.size \
+            and self._moves & self._engine.square_to_bit(move[0], move[1]) != 0
 
-        for pos in [(row, col) for row in range(0, self._board.size)
-                    for col in range(0, self._board.size)]:
-            piece = self._board.get_piece(row=pos[0], column=pos[1])
-            if piece in (-current_player, 0):
-                continue
+    def _apply_move(self, move: Tuple[int, int]) -> int:
+        """Play move for the current player, flipping pieces and passing the turn to the
+        other player. Return the bitboard of the flipped pieces.
 
-            current_p = current_player
+        Preconditions:
+        - move is a currently valid move
+        """
+        engine = self._engine
+        index = move[0] * engine.size + move[1]
+        move_bit = 1 << index
+        if self._current_player == _BLACK:
+            flips = engine.get_flips(self._black, self._white, move_bit)
+            self._black |= flips | move_bit
+            self._white ^= flips
+            self._hashes ^= engine.symmetric_black_keys[index]
+        else:
+            flips = engine.get_flips(self._white, self._black, move_bit)
+            self._white |= flips | move_bit
+            self._black ^= flips
+            self._hashes ^= engine.symmetric_white_keys[index]
+        self._hashes ^= engine.get_symmetric_flips_hash(flips) ^ engine.symmetric_white_to_move_key
+
+        # Only the placed and flipped pieces change in the list-of-lists view, the piece
+        # counts and the positional score.
+        changed_squares = engine.bits_to_squares(flips | move_bit)
+        for row, column in changed_squares:
+            self._board.pieces[row][column] = self._current_player
+        num_flips = len(changed_squares) - 1
+        if self._heuristic_list is not None:
+            # a flipped piece moves its weight from one player's sum to the other's
+            self._score -= (self._weights[index] + 2 * self._sum_weights(flips)) \
+                * self._current_player
+        if self._current_player == _BLACK:
+            self._num_black += num_flips + 1
+            self._num_white -= num_flips
+        else:
+            self._num_white += num_flips + 1
+            self._num_black -= num_flips
 
-            for direction in {(-1, -1), (-1, 0), (-1, 1), (0, -1), (0, 1), (1, -1), (1, 0), (1, 1)}:
-                self._find_moves_and_paths_in_direction(moves_and_paths, pos, current_p, direction)
+        self._current_player = -self._current_player
+        self._move_count += 1
+        self._recalculate_valid_moves()
 
-        return moves_and_paths
+        return flips
 
-    def _find_moves_and_paths_in_direction(self, moves_and_paths: Tuple[Set[Tuple[int, int]],
-                                                                        Set[Tuple[
-                                                                            Tuple[int, int], Tuple[
-                                                                                int, int]]]],
-                                           pos: Tuple[int, int],
-                                           current_player: int, direction: Tuple[int, int]) -> None:
-        """Find a valid move moving in a given direction from a certain position, and store
-           the path from the start square to the square on which the move is executed.
+    def _sum_weights(self, bits: int) -> int:
+        """Return the sum of the weights of the squares in bits in self._heuristic_list.
 
         Preconditions:
-        - current_player in [_BLACK, _WHITE]
-        - direction in {(-1, -1), (-1, 0), (-1, 1), (0, -1), (0, 1), (1, -1), (1, 0), (1, 1)}
-        """
-        stop = False
-        i = 1
-        other_player = -current_player
-        while not stop:
-            row, col = pos[0] + direction[0] * i, pos[1] + direction[1] * i
-
-            if row < 0 or col < 0 or row >= self._board.size or col >= self._board.size:
-                break  # Out of bounds
-            # Break if there is another current_player piece in that direction or the first
-            # space in that direction is empty
-            if self._board.get_piece(row=row, column=col) == current_player or \
-                    (self._board.get_piece(row=row, column=col) == 0
-                     and (row, col) == (pos[0] + direction[0], pos[1] + direction[1])):
-                break
-            if self._board.get_piece(row=row, column=col) == other_player:
-                pass
-            # We have passed at least one of other_player pieces and reached an empty space
-            else:
-                moves_and_paths[0].add((row, col))
-                moves_and_paths[1].add(((pos[0], pos[1]), (row, col)))
-                break
-
-            i += 1
-
-    def _board_after_move(self, move: Tuple[int, int]) -> list[list[int]]:
-        """Return a copy of self._board.pieces representing the state of
-        the board after making move.
-
-        Precondition:
-        x in list(range(self._board.size)) for x in move
+        - self._heuristic_list is not None
         """
-
-        paths = self._calculate_moves_and_paths_for_board(self.get_current_player())[1]
-        filter_paths = {p for p in paths if p[1] == move}
-        board_copy = copy.deepcopy(self._board.pieces)
-        board_copy[move[0]][move[1]] = self.get_current_player()
-        for path in filter_paths:
-            direction = get_direction(path[0], path[1])
-            piece_x = path[0][0] + direction[0]
-            piece_y = path[0][1] + direction[1]
-            while (piece_x, piece_y) != path[1]:
-                board_copy[piece_x][piece_y] = self.get_current_player()
-                piece_x += direction[0]
-                piece_y += direction[1]
-
-        return board_copy
+        total = 0
+        while bits:
+            lowest = bits & -bits
+            total += self._weights[lowest.bit_length() - 1]
+            bits ^= lowest
+        return total
 
     def _recalculate_valid_moves(self) -> None:
         """Update the valid moves for this game board."""
 
-        self._board.valid_moves = self._calculate_moves_and_paths_for_board(
-            self.get_current_player())[0]
+        if self._current_player == _BLACK:
+            self._moves = self._engine.get_moves(self._black, self._white)
+        else:
+            self._moves = self._engine.get_moves(self._white, self._black)
+        self._valid_moves_stale = True
+        self._update_winner()
 
+    def _update_winner(self) -> None:
+        """Update self._winner for the current position.
 
-def get_direction(v1: Tuple[int, int], v2: Tuple[int, int]) -> list[int, int]:
-    """Get tuple representing direction vector between v1 and v2"""
-    direction = [0, 0]
-    for i in range(2):
-        if v2[i] - v1[i] == 0:
-            pass
+        The game is over when the current player has no valid moves.
+        """
+        if self._moves != 0:
+            self._winner = None
+        elif self._num_black > self._num_white:
+            self._winner = 'black'
+        elif self._num_black < self._num_white:
+            self._winner = 'white'
         else:
-            direction[i] = int((v2[i] - v1[i]) / abs(v2[i] - v1[i]))
-    return direction
+            self._winner = 'draw'
+
+    def _update_valid_moves_set(self) -> None:
+        """Rebuild self._board.valid_moves from self._moves if it is out of date."""
+
+        if self._valid_moves_stale:
+            self._board.valid_moves = self._engine.bits_to_squares(self._moves)
+            self._valid_moves_stale = False
 
 
 if __name__ == "__main__":
@@ -284,7 +552,7 @@ if __name__ == "__main__":
 
     python_ta.check_all(config={
         # the names (strs) of imported modules
-        'extra-imports': ['copy', 'time', 'board'],
+        'extra-imports': ['time', 'board', 'bitboard'],
         'allowed-io': [],  # the names (strs) of functions that call print/open/input
         'max-line-length': 100,
 
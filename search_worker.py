@@ -0,0 +1,162 @@
+"""
+search_worker.py:
+Contains a class that runs an AI player's search on a background thread.
+CSC111 Final Project by Anatoly Zavyalov, Baker Jackson, Elliot Schrider, Rachel Kim
+
+Copyright 2021 Anatoly Zavyalov, Baker Jackson, Elliot Schrider, Rachel Kim
+
+Permission is hereby granted, free of charge, to any person obtaining a copy of this software and
+associated documentation files (the "Software"), to deal in the Software without restriction,
+including without limitation the rights to use, copy, modify, merge, publish, distribute,
+sublicense, and/or sell copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all copies or substantial
+portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR IMPLIED, INCLUDING BUT
+NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND
+NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM,
+DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+"""
+
+import threading
+from typing import Hashable, Optional, Tuple
+
+from ai_players import Player
+from reversi import ReversiGame
+
+
+class SearchWorker:
+    """Runs AI players' searches on a background thread, so that the window keeps updating
+    while an AI is thinking.
+
+    Each search is run on a copy of the game. A cancelled search is asked to stop with
+    Player.stop, and its move is thrown away. No new search is started until it has ended, so
+    that a player is never used by two searches at once.
+
+    Sample Usage:
+    >>> import ai_players
+    >>> worker = SearchWorker()
+    >>> game = ReversiGame()
+    >>> player = ai_players.RandomPlayer()
+    >>> move = None
+    >>> while move is None:
+    ...     move = worker.request_move(player, game, (-1, -1))
+    >>> move in game.get_valid_moves()
+    True
+    """
+
+    # Private Instance Attributes:
+    # - _thread: the thread running the current search, or None if no search was started
+    # - _player: the player making the current search
+    # - _key: the (board size, hash, current player) of the position of the current search
+    # - _move: the move found by the current search, or None if it has not finished
+    # - _error: the exception raised by the current search, or None if it did not raise one
+    # - _cancelled: whether the current search was cancelled
+
+    _thread: Optional[threading.Thread]
+    _player: Optional[Player]
+    _key: Optional[Hashable]
+    _move: Optional[Tuple[int, int]]
+    _error: Optional[Exception]
+    _cancelled: bool
+
+    def __init__(self) -> None:
+        """Initialize a worker with no search."""
+        self._thread = None
+        self._player = None
+        self._key = None
+        self._move = None
+        self._error = None
+        self._cancelled = False
+
+    def request_move(self, player: Player, game: ReversiGame,
+                     previous_move: Tuple[int, int]) -> Optional[Tuple[int, int]]:
+        """Return the move player makes in game, or None if it is not known yet.
+
+        If no search for player in the current position of game is running, cancel the search
+        that is running and start one once the worker is free. Call this method again (e.g.
+        every frame) until it returns a move.
+
+        Preconditions:
+            - game.get_winner() is None
+        """
+        key = _get_position_key(game)
+        if self._player is not player or self._key != key:
+            self.cancel()
+        elif not self._cancelled and not self.is_busy():
+            move, error = self._move, self._error
+            self._player, self._key = None, None
+            if error is not None:
+                raise error
+            return move
+
+        if not self.is_busy():
+            self._start_search(player, game, previous_move)
+        return None
+
+    def cancel(self, wait: bool = False) -> None:
+        """Cancel the current search, if there is one. If wait is True, return only once the
+        search has ended, so that its player can be changed safely."""
+        self._cancelled = True
+        if self.is_busy():
+            self._player.stop()
+            if wait:
+                self._thread.join()
+
+    def is_busy(self) -> bool:
+        """Return whether a search (possibly a cancelled one) is still running."""
+        return self._thread is not None and self._thread.is_alive()
+
+    def _start_search(self, player: Player, game: ReversiGame,
+                      previous_move: Tuple[int, int]) -> None:
+        """Start searching for player's move in game on a new thread.
+
+        Preconditions:
+            - not self.is_busy()
+        """
+        self._player = player
+        self._key = _get_position_key(game)
+        self._move = None
+        self._error = None
+        self._cancelled = False
+        player.resume()
+        self._thread = threading.Thread(target=self._search,
+                                        args=(player, game.copy(), previous_move),
+                                        daemon=True)
+        self._thread.start()
+
+    def _search(self, player: Player, game: ReversiGame,
+                previous_move: Tuple[int, int]) -> None:
+        """Store the move player makes in game. This is run on the search thread."""
+        try:
+            self._move = player.make_move(game, previous_move)
+        except Exception as error:  # passed on to the main thread by request_move
+            self._error = error
+
+
+def _get_position_key(game: ReversiGame) -> Hashable:
+    """Return a value identifying the current position of game."""
+    return (game.get_board().size, game.get_hash(), game.get_current_player())
+
+
+if __name__ == "__main__":
+    # Test doctests
+    import doctest
+    doctest.testmod(verbose=True)
+
+    import python_ta.contracts
+    python_ta.contracts.check_all_contracts()
+
+    import python_ta
+    python_ta.check_all(config={
+        # the names (strs) of imported modules
+        'extra-imports': ['threading', 'typing', 'ai_players', 'reversi'],
+        'allowed-io': [],  # the names (strs) of functions that call print/open/input
+        'max-line-length': 100,
+
+        # Disable too-many-nested-blocks, too-many-arguments
+        'disable': ['E1136', 'R1702', 'R0913', 'W0703']
+    })
@@ -126,6 +126,12 @@ def player_to_string(game: reversi.ReversiGame, player_colour: str, player: ai_p
         # the player is one of the AI players
         if isinstance(player, ai_players.RandomPlayer):
             return 'Random Moves'
+        elif isinstance(player, ai_players.TimedMinimaxABPlayer):
+            return 'Timed ' + str(player.time_limit) + 's'
+        elif isinstance(player, ai_players.MTDFPlayer):
+            return 'MTD(f) ' + str(player.depth)
+        elif isinstance(player, ai_players.PVSPlayer):
+            return 'PVS ' + str(player.depth)
         elif (isinstance(player, ai_players.MinimaxPlayer)
               or isinstance(player, ai_players.MinimaxABPlayer)):
             return 'Minimax ' + str(player.depth)
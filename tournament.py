@@ -0,0 +1,143 @@
+"""
+tournament.py:
+Contains functions that play many games between two AI players in parallel.
+CSC111 Final Project by Anatoly Zavyalov, Baker Jackson, Elliot Schrider, Rachel Kim
+
+Copyright 2021 Anatoly Zavyalov, Baker Jackson, Elliot Schrider, Rachel Kim
+
+Permission is hereby granted, free of charge, to any person obtaining a copy of this software and
+associated documentation files (the "Software"), to deal in the Software without restriction,
+including without limitation the rights to use, copy, modify, merge, publish, distribute,
+sublicense, and/or sell copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all copies or substantial
+portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR IMPLIED, INCLUDING BUT
+NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND
+NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM,
+DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+"""
+
+import os
+import pickle
+import random
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from typing import Iterator, Optional, Tuple
+
+import ai_players
+import reversi
+
+# The pickled (player1, player2) pair of the worker process. Every game unpickles its own copy
+# of the players, so that a game does not depend on the games the worker played before it.
+_WORKER_PLAYERS = b''
+
+
+def play_game(player1: ai_players.Player, player2: ai_players.Player, board_size: int,
+              seed: int) -> str:
+    """Play a game between player1 (black) and player2 (white) on a board_size by board_size
+    board, with the random number generator seeded with seed, and return the winner.
+
+    Preconditions:
+        - board_size >= 2
+        - board_size % 2 == 0
+
+    >>> player = ai_players.RandomPlayer()
+    >>> play_game(player, player, 8, 0) in {'white', 'black', 'draw'}
+    True
+    >>> play_game(player, player, 8, 1) == play_game(player, player, 8, 1)
+    True
+    """
+    random.seed(seed)
+    game = reversi.ReversiGame()
+    game.set_board_size(board_size)
+    game.start_game()
+    prev_move = (-1, -1)
+    while game.get_winner() is None:
+        move = player1.make_move(game, prev_move)
+        game.try_make_move(move)
+        if game.get_winner() is None:
+            prev_move = player2.make_move(game, move)
+            game.try_make_move(prev_move)
+    return game.get_winner()
+
+
+def iter_tournament(player1: ai_players.Player, player2: ai_players.Player, board_size: int,
+                    iterations: int, workers: Optional[int] = None,
+                    seed: int = 0) -> Iterator[Tuple[int, str]]:
+    """Play iterations games between player1 (black) and player2 (white) on a board_size by
+    board_size board, spread over workers worker processes (or one per CPU if workers is None),
+    and yield (game number, winner) as soon as each game finishes.
+
+    Game i is played with the random number generator seeded with seed + i, and with fresh
+    copies of the players as they were when the tournament started, so its result does not
+    depend on the number of workers or on which worker plays it.
+
+    Preconditions:
+        - board_size >= 2
+        - board_size % 2 == 0
+        - iterations >= 0
+        - workers is None or workers > 0
+        - player1 and player2 can be pickled (so they are not ParallelMinimaxABPlayers)
+    """
+    if workers is None:
+        workers = os.cpu_count() or 1
+    players = pickle.dumps((player1, player2))
+    with ProcessPoolExecutor(workers, initializer=_init_worker,
+                             initargs=(players,)) as executor:
+        futures = {executor.submit(_play_worker_game, board_size, seed + i): i
+                   for i in range(iterations)}
+        for future in as_completed(futures):
+            yield futures[future], future.result()
+
+
+def run_tournament(player1: ai_players.Player, player2: ai_players.Player, board_size: int,
+                   iterations: int, workers: Optional[int] = None, seed: int = 0) -> list[str]:
+    """Play iterations games like iter_tournament, and return the list of winners in game
+    order, in the format used by stats.plot_game_statistics.
+
+    Preconditions:
+        - board_size >= 2
+        - board_size % 2 == 0
+        - iterations >= 0
+        - workers is None or workers > 0
+        - player1 and player2 can be pickled (so they are not ParallelMinimaxABPlayers)
+    """
+    results = [''] * iterations
+    for i, winner in iter_tournament(player1, player2, board_size, iterations, workers, seed):
+        results[i] = winner
+    return results
+
+
+def _init_worker(players: bytes) -> None:
+    """Initialize a tournament worker process with the pickled (player1, player2) pair."""
+    global _WORKER_PLAYERS
+    _WORKER_PLAYERS = players
+
+
+def _play_worker_game(board_size: int, seed: int) -> str:
+    """Play a game between fresh copies of the worker's players, and return the winner."""
+    player1, player2 = pickle.loads(_WORKER_PLAYERS)
+    return play_game(player1, player2, board_size, seed)
+
+
+if __name__ == '__main__':
+    import python_ta.contracts
+
+    python_ta.contracts.check_all_contracts()
+
+    import doctest
+
+    doctest.testmod()
+
+    import python_ta
+
+    python_ta.check_all(config={
+        'extra-imports': ['os', 'pickle', 'random', 'concurrent.futures', 'typing',
+                          'ai_players', 'reversi'],  # the names (strs) of imported modules
+        'allowed-io': [],  # the names (strs) of functions that call print/open/input
+        'max-line-length': 100,
+        'disable': ['E1136']
+    })
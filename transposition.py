@@ -0,0 +1,162 @@
+"""
+transposition.py:
+Contains the TranspositionTable class, used by the AIs to remember positions they have searched.
+CSC111 Final Project by Anatoly Zavyalov, Baker Jackson, Elliot Schrider, Rachel Kim
+
+Copyright 2021 Anatoly Zavyalov, Baker Jackson, Elliot Schrider, Rachel Kim
+
+Permission is hereby granted, free of charge, to any person obtaining a copy of this software and
+associated documentation files (the "Software"), to deal in the Software without restriction,
+including without limitation the rights to use, copy, modify, merge, publish, distribute,
+sublicense, and/or sell copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all copies or substantial
+portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR IMPLIED, INCLUDING BUT
+NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND
+NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM,
+DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+"""
+
+from typing import List, Optional, Tuple
+
+# The kinds of scores stored in a TranspositionTable entry. An EXACT score is the minimax value
+# of the position, a LOWER score is a lower bound on it (the search failed high), and an UPPER
+# score is an upper bound on it (the search failed low).
+EXACT = 0
+LOWER = 1
+UPPER = 2
+
+# Rough number of bytes used by one entry (the tuple, its key and its best move).
+_ENTRY_BYTES = 200
+
+
+class TranspositionTable:
+    """A fixed-size table of searched positions, keyed by the Zobrist hash of the position
+    (see ReversiGame.get_hash and ReversiGame.get_canonical_hash).
+
+    Each entry is a tuple (key, depth, flag, best_move, score), where depth is the number of
+    moves that were searched below the position and flag is one of EXACT, LOWER or UPPER.
+
+    The table is split into buckets of two entries. The first entry of a bucket is
+    depth-preferred: it is only replaced by a search that is at least as deep. The second entry
+    is always replaced, so recent positions are still remembered when the first entry holds a
+    deeper one.
+
+    Instance Attributes:
+     - hits: the number of calls to probe that found the position
+     - misses: the number of calls to probe that did not find the position
+     - stores: the number of calls to store
+
+    Representation Invariants:
+     - len(self._entries) == 2 * self._num_buckets
+
+    >>> table = TranspositionTable(max_memory_mb=1)
+    >>> table.store(key=12345, depth=3, flag=EXACT, best_move=(2, 4), score=10)
+    >>> table.probe(12345)
+    (12345, 3, 0, (2, 4), 10)
+    >>> table.probe(54321) is None
+    True
+    >>> (table.hits, table.misses)
+    (1, 1)
+    """
+
+    hits: int
+    misses: int
+    stores: int
+
+    # Private Instance Attributes:
+    # - _num_buckets: the number of buckets in the table
+    # - _entries: the entries of the table. The entries of bucket i are at 2 * i (the
+    #             depth-preferred entry) and 2 * i + 1 (the always-replace entry).
+
+    _num_buckets: int
+    _entries: List[Optional[Tuple[int, int, int, Optional[Tuple[int, int]], float]]]
+
+    def __init__(self, max_memory_mb: float = 16.0) -> None:
+        """Create an empty table that uses at most about <max_memory_mb> megabytes.
+
+        Preconditions:
+         - max_memory_mb > 0
+        """
+        self._num_buckets = max(1, int(max_memory_mb * 2 ** 20) // (2 * _ENTRY_BYTES))
+        self._entries = [None] * (2 * self._num_buckets)
+        self.hits = 0
+        self.misses = 0
+        self.stores = 0
+
+    def probe(self, key: int) -> Optional[Tuple[int, int, int, Optional[Tuple[int, int]], float]]:
+        """Return the entry stored for the position with hash <key>, or None if there is none."""
+        index = 2 * (key % self._num_buckets)
+        entry = self._entries[index]
+        if entry is not None and entry[0] == key:
+            self.hits += 1
+            return entry
+        entry = self._entries[index + 1]
+        if entry is not None and entry[0] == key:
+            self.hits += 1
+            return entry
+        self.misses += 1
+        return None
+
+    def peek(self, key: int) -> Optional[Tuple[int, int, int, Optional[Tuple[int, int]], float]]:
+        """Return the entry stored for the position with hash <key>, or None if there is none,
+        without counting a hit or a miss."""
+        index = 2 * (key % self._num_buckets)
+        for entry in self._entries[index:index + 2]:
+            if entry is not None and entry[0] == key:
+                return entry
+        return None
+
+    def store(self, key: int, depth: int, flag: int, best_move: Optional[Tuple[int, int]],
+              score: float) -> None:
+        """Store the result of searching the position with hash <key> to <depth> moves.
+
+        Preconditions:
+         - flag in {EXACT, LOWER, UPPER}
+        """
+        self.stores += 1
+        index = 2 * (key % self._num_buckets)
+        deepest = self._entries[index]
+        if deepest is None or deepest[0] == key or deepest[1] <= depth:
+            self._entries[index] = (key, depth, flag, best_move, score)
+        else:
+            self._entries[index + 1] = (key, depth, flag, best_move, score)
+
+    def clear(self) -> None:
+        """Remove every entry from the table and reset the counters."""
+        self._entries = [None] * (2 * self._num_buckets)
+        self.hits = 0
+        self.misses = 0
+        self.stores = 0
+
+    def get_hit_rate(self) -> float:
+        """Return the fraction of calls to probe that found the position, or 0.0 if probe has
+        not been called yet."""
+        if self.hits + self.misses == 0:
+            return 0.0
+        return self.hits / (self.hits + self.misses)
+
+
+if __name__ == "__main__":
+    # Test doctests
+    import doctest
+    doctest.testmod()
+
+    import python_ta.contracts
+
+    python_ta.contracts.check_all_contracts()
+
+    import python_ta
+    python_ta.check_all(config={
+        # the names (strs) of imported modules
+        'extra-imports': [],
+        'allowed-io': [],  # the names (strs) of functions that call print/open/input
+        'max-line-length': 100,
+
+        # Disable too-many-nested-blocks, too-many-arguments
+        'disable': ['E1136', 'R1702', 'R0913']
+    })
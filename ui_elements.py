@@ -21,7 +21,7 @@ DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE,
 OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
 """
 
-from typing import Tuple, List
+from typing import Tuple, List, Optional
 import pygame
 import pygame_gui
 
@@ -96,6 +96,10 @@ class UIElement(Element):
         """Return whether UIElement instance is equal to another instance."""
         return self._element == other
 
+    def get_element(self) -> pygame_gui.core.ui_element.UIElement:
+        """Return the pygame_gui UIElement instance wrapped by this UIElement."""
+        return self._element
+
     def set_visible(self, visible: bool) -> None:
         """Change the visibility of the UI element."""
         self._element.visible = visible
@@ -231,9 +235,16 @@ class Text(Element):
     visible: bool
     large_font: bool
 
+    # Private Instance Attributes:
+    # - _surface: the rendered text, or None if it has to be rendered again because the text
+    #             changed since it was last rendered
+
+    _surface: Optional[pygame.Surface]
+
     def __init__(self, text: str, position: Tuple[int, int], large_font: bool = True) -> None:
         """Initialize the text contents as well as the position of the text."""
-        self.set_text(text)
+        self.text = text
+        self._surface = None
         self.position = position
         self.visible = True
         self.large_font = large_font
@@ -241,8 +252,18 @@ class Text(Element):
         super().__init__("text")
 
     def set_text(self, text: str) -> None:
-        """Set the text of the Text."""
-        self.text = text
+        """Set the text of the Text. The rendered text is thrown away if the text changed."""
+        if text != self.text:
+            self.text = text
+            self._surface = None
+
+    def get_surface(self) -> Optional[pygame.Surface]:
+        """Return the rendered text, or None if it has to be rendered."""
+        return self._surface
+
+    def set_surface(self, surface: pygame.Surface) -> None:
+        """Store surface as the rendered text, to be drawn until the text is changed."""
+        self._surface = surface
 
     def execute(self, text: str = "") -> None:
         """Nothing is to be done when text is pressed."""
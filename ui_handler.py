@@ -27,7 +27,8 @@ import pygame
 from reversi import ReversiGame
 from typing import List, Dict
 from stats import plot_game_statistics
-from ai_players import RandomPlayer, MinimaxABPlayer
+from ai_players import make_player
+from search_worker import SearchWorker
 
 
 def increment_player_score(player: str, w: window.Window) -> None:
@@ -64,16 +65,19 @@ def helper_dropdown_select_player(g: ReversiGame, text: str) -> None:
         g.start_game(human_player=0)
 
 
-def helper_dropdown_select_board_size(g: ReversiGame,
-                                      colour_to_player: Dict, text: str) -> None:
+def helper_dropdown_select_board_size(g: ReversiGame, colour_to_player: Dict,
+                                      search_worker: SearchWorker, text: str) -> None:
     """
-    Set the board size given the text.
+    Set the board size given the text. The AI search that is running (if any) is stopped first,
+    so that the players are not changed in the middle of it.
     Preconditions:
         - text is of the form '<int>x<int>' where the two
           integers are the same and greater than 0.
     """
     global board_size_current
 
+    search_worker.cancel(wait=True)
+
     # Update the current board size (why?)
     board_size_current = int(text.split('x')[0])
 
@@ -109,32 +113,35 @@ class UIHandler:
         """Set the AI given the text.
 
         Preconditions:
-            - text in {'Minimax 2', 'Minimax 3', 'Minimax 4', 'Minimax 8', 'Random Moves'}
+            - text in {'Minimax 2', 'Minimax 3', 'Minimax 4', 'Minimax 6', 'PVS 4', 'PVS 6',
+                       'Timed 0.2s', 'Timed 1s', 'Random Moves'}
         """
 
-        if text.startswith('Minimax '):
-            colour_to_player.update({black: MinimaxABPlayer(int(text.split("Minimax ")[-1]),
-                                                            self.board_size_current)})
-        else:
-            colour_to_player.update({black: RandomPlayer()})
+        colour_to_player.update({black: make_player(text, self.board_size_current)})
 
     def dropdown_select_ai(self, black: int, colour_to_player: Dict) -> any:
         """Return a function for setting the AI given the text."""
 
         return lambda text: self.helper_dropdown_select_ai(black, colour_to_player, text)
 
-    def dropdown_select_board_size(self, g: ReversiGame, colour_to_player: Dict) -> any:
+    def dropdown_select_board_size(self, g: ReversiGame, colour_to_player: Dict,
+                                   search_worker: SearchWorker) -> any:
         """Return a function for setting the board size given the text.
         Preconditions:
          - text is of the form '<int>x<int>' where the two integers are the same.
         """
 
-        return lambda text: helper_dropdown_select_board_size(g, colour_to_player, text)
+        return lambda text: helper_dropdown_select_board_size(g, colour_to_player,
+                                                              search_worker, text)
 
     def update_games_stored_text(self, games: int, w: window.Window) -> None:
         """Update the 'Games Stored' label with to display 'Games Stored: <games>'."""
         w.get_ui_element('text-games-stored').set_text(f'Games Stored: {games}')
 
+    def update_thinking_text(self, thinking: bool, w: window.Window) -> None:
+        """Show the 'Thinking...' label if thinking is True, and hide it otherwise."""
+        w.get_ui_element('text-thinking').set_visible(thinking)
+
     def clear_results(self, results: List, w: window.Window) -> None:
         """Clear the results list by MUTATING it and update the Games Store text accordingly."""
 
@@ -161,7 +168,7 @@ class UIHandler:
         return self.game_paused
 
     def add_ui(self, w: window.Window, g: ReversiGame,
-               results: List, colour_to_player: Dict) -> None:
+               results: List, colour_to_player: Dict, search_worker: SearchWorker) -> None:
         """
         Add some UI to the window, such as buttons, and more.
         """
@@ -189,14 +196,16 @@ class UIHandler:
                    large_font=False)
 
         w.add_dropdown(options_list=["Random Moves", "Minimax 2", 'Minimax 3',
-                                     'Minimax 4', 'Minimax 6'],
+                                     'Minimax 4', 'Minimax 6', 'PVS 4', 'PVS 6', 'Timed 0.2s',
+                                     'Timed 1s'],
                        starting_option="Minimax 2",
                        rect=pygame.Rect(675, 300, 125, 40),
                        label="dropdown-ai-black",
                        function=self.dropdown_select_ai(1, colour_to_player))
 
         w.add_dropdown(options_list=["Random Moves", "Minimax 2", 'Minimax 3',
-                                     'Minimax 4', 'Minimax 6'],
+                                     'Minimax 4', 'Minimax 6', 'PVS 4', 'PVS 6', 'Timed 0.2s',
+                                     'Timed 1s'],
                        starting_option="Minimax 2",
                        rect=pygame.Rect(810, 300, 125, 40),
                        label="dropdown-ai-white",
@@ -207,7 +216,8 @@ class UIHandler:
                        starting_option="8x8",
                        rect=pygame.Rect(725, 480, 150, 40),
                        label="dropdown-board-size",
-                       function=self.dropdown_select_board_size(g, colour_to_player))
+                       function=self.dropdown_select_board_size(g, colour_to_player,
+                                                                search_worker))
 
         w.add_button(rect=pygame.Rect(675, 610, 125, 40),
                      label="button-show-stats", text="View Stats",
@@ -220,6 +230,9 @@ class UIHandler:
 
         w.add_text(label="text-games-stored", text="Games Stored: 0", position=(715, 665))
 
+        w.add_text(label="text-thinking", text="Thinking...", position=(745, 560))
+        w.get_ui_element('text-thinking').set_visible(False)
+
         w.add_text(label="text-credits",
                    text="Anatoly Zavyalov, Baker Jackson, Elliot Schrider, Rachel Kim",
                    position=(20, 2), large_font=False)
@@ -236,7 +249,8 @@ if __name__ == "__main__":
     import python_ta
     python_ta.check_all(config={
         # the names (strs) of imported modules
-        'extra-imports': ['window', 'pygame', 'reversi', 'stats', 'ai_players'],
+        'extra-imports': ['window', 'pygame', 'reversi', 'stats', 'ai_players',
+                          'search_worker'],
         'allowed-io': [],  # the names (strs) of functions that call print/open/input
         'max-line-length': 100,
 
@@ -21,10 +21,10 @@ DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE,
 OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
 """
 
-from typing import Dict, List, Tuple, Set, Union
+from typing import Callable, Dict, List, Tuple, Set, Union
 import pygame
 import pygame_gui
-from ui_elements import Element, Button, Text, Dropdown
+from ui_elements import Element, UIElement, Button, Text, Dropdown
 
 
 class Window:
@@ -49,6 +49,11 @@ class Window:
     # - _gui_manager: pygame_gui UI Manager instance
     # - _background_surface: a solid color for the surface
     # - _ui_elements: UI elements stored by the window, labelled by strings.
+    # - _text_elements: The Text elements in _ui_elements, in the order they were added.
+    # - _wrappers: The buttons and dropdowns in _ui_elements, keyed by the pygame_gui element
+    #              they wrap, so that the element that fired an event can be found directly.
+    # - _user_event_handlers: The methods that handle pygame_gui events, keyed by the
+    #                         event's user_type.
     # - _clock: pygame.time.Clock instance, used for updating GUI
     # - _time_delta: the time delta in milliseconds for this update
     # - _large_font: PyGame font instance, used for rendering text.
@@ -64,6 +69,9 @@ class Window:
     _running: bool
 
     _ui_elements: Dict[str, Element]
+    _text_elements: List[Text]
+    _wrappers: Dict[pygame_gui.core.ui_element.UIElement, UIElement]
+    _user_event_handlers: Dict[int, Callable[[pygame.event.Event], None]]
 
     _screen: pygame.Surface
     _gui_manager: pygame_gui.UIManager
@@ -89,6 +97,12 @@ class Window:
         self._height = 700
         self._title = "Reversi B)"
         self._ui_elements = {}
+        self._text_elements = []
+        self._wrappers = {}
+        self._user_event_handlers = {
+            pygame_gui.UI_BUTTON_PRESSED: self._handle_button_pressed,
+            pygame_gui.UI_DROP_DOWN_MENU_CHANGED: self._handle_dropdown_changed
+        }
 
         self._events = set()
 
@@ -164,18 +178,8 @@ class Window:
 
             # User event
             elif event.type == pygame.USEREVENT:
-
-                # Loop through every UI element, and check if it is the UI element that was
-                # triggered. THIS IS BAD AND INEFFICIENT!
-                for element in self._ui_elements:
-                    if event.ui_element == self._ui_elements[element]:
-                        if event.user_type == pygame_gui.UI_BUTTON_PRESSED:
-                            if self._ui_elements[element].get_type() == "button":
-                                self._ui_elements[element].execute()
-                                break
-                        elif event.user_type == pygame_gui.UI_DROP_DOWN_MENU_CHANGED:
-                            if self._ui_elements[element].get_type() == "dropdown":
-                                self._ui_elements[element].execute(event.text)
+                if event.user_type in self._user_event_handlers:
+                    self._user_event_handlers[event.user_type](event)
 
             elif event.type == pygame.MOUSEBUTTONUP:
                 events_so_far.add((pygame.MOUSEBUTTONUP, pygame.mouse.get_pos()))
@@ -184,6 +188,21 @@ class Window:
 
         return events_so_far
 
+    def _handle_button_pressed(self, event: pygame.event.Event) -> None:
+        """Call the function of the button that was pressed in event."""
+
+        element = self._wrappers.get(event.ui_element)
+        if element is not None and element.get_type() == "button":
+            element.execute()
+
+    def _handle_dropdown_changed(self, event: pygame.event.Event) -> None:
+        """Call the function of the dropdown that was changed in event with the selected
+        option."""
+
+        element = self._wrappers.get(event.ui_element)
+        if element is not None and element.get_type() == "dropdown":
+            element.execute(event.text)
+
     def add_button(self, rect: pygame.Rect, label: str, text: str, function: any) -> None:
         """
         Add a button to list of buttons.
@@ -197,6 +216,7 @@ class Window:
         """
         self._ui_elements[label] = Button(rect=rect, label=text,
                                           manager=self._gui_manager, function=function)
+        self._wrappers[self._ui_elements[label].get_element()] = self._ui_elements[label]
 
     def add_slider(self, rect: pygame.Rect, label: str,
                    start_value: float, value_range: Tuple[float, float]) -> None:
@@ -228,6 +248,7 @@ class Window:
          - label not in self._ui_elements
         """
         self._ui_elements[label] = Text(text, position, large_font)
+        self._text_elements.append(self._ui_elements[label])
 
     def add_dropdown(self, options_list: List[str], starting_option: str,
                      rect: pygame.Rect, label: str, function: any) -> None:
@@ -244,6 +265,7 @@ class Window:
                                             rect=rect,
                                             manager=self._gui_manager,
                                             function=function)
+        self._wrappers[self._ui_elements[label].get_element()] = self._ui_elements[label]
 
     def is_running(self) -> bool:
         """
@@ -297,20 +319,21 @@ class Window:
         """
 
         if text.get_visible():
-            surface = self.render_text(text=text.text, large_font=text.large_font)
+            # The text is only rendered again after it changes
+            surface = text.get_surface()
+            if surface is None:
+                surface = self.render_text(text=text.text, large_font=text.large_font)
+                text.set_surface(surface)
 
             self.draw_to_screen(surface, text.position)
 
     def _draw_text_elements(self) -> None:
         """
         Draw the text elements.
-
-        THIS IS SUPER INEFFICIENT, LOOK FOR A BETTER WAY TO DO THIS!
         """
 
-        for element in self._ui_elements:
-            if self._ui_elements[element].get_type() == 'text':
-                self.draw_text(self._ui_elements[element])
+        for text in self._text_elements:
+            self.draw_text(text)
 
     def get_ui_element(self, label: str) -> Element:
         """Given a label, look for a UI element and return it.